@@ -9,76 +9,92 @@ _STRONG_SENT_BOUNDARY_RE = re.compile(r"(?<=[.!?;:。！？；：])\s+")
 _WEAK_SENT_BOUNDARY_RE = re.compile(r"(?<=[,，])\s+")
 
 
-def _split_text_to_fit_tokens(text: str, *, count_tokens: Callable[[str], int], max_tokens: int) -> list[str]:
+def _split_text_to_fit_tokens(
+    text: str, *, count_tokens: Callable[[str], int], max_tokens: int
+) -> list[tuple[str, int]]:
+    # Returns (chunk, token_count) pairs; the counts are the ones measured while splitting,
+    # so callers don't tokenize each chunk a second time. 0 means the count is unknown.
+    def safe_count(s: str) -> int:
+        try:
+            return count_tokens(s) or 0
+        except Exception:  # noqa: BLE001
+            return 0
+
     if not text:
-        return [""]
+        return [("", 0)]
     if max_tokens <= 0:
-        return [text]
+        return [(text, safe_count(text))]
 
-    try:
-        total = count_tokens(text)
-    except Exception:  # noqa: BLE001
-        total = 0
+    total = safe_count(text)
     if total and total <= max_tokens:
-        return [text]
+        return [(text, total)]
 
     # Collect candidate cut positions (greedy). We preserve original whitespace by cutting at match.end().
     positions = [m.end() for m in _STRONG_SENT_BOUNDARY_RE.finditer(text)]
     if not positions:
         positions = [m.end() for m in _WEAK_SENT_BOUNDARY_RE.finditer(text)]
 
-    def hard_split(start: int) -> int:
+    def hard_split(start: int) -> tuple[int, int]:
         # Approximate: 1 token ~= 3 chars (English) or ~= 1 char (CJK). Use a conservative cap.
         cap = max(64, int(max_tokens * 3))
         end = min(len(text), start + cap)
         if end <= start:
-            return min(len(text), start + 1)
+            return (min(len(text), start + 1), 0)
+        n = 0
         while end > start + 32:
             try:
-                if count_tokens(text[start:end]) <= max_tokens:
+                n = count_tokens(text[start:end])
+                if n <= max_tokens:
                     break
             except Exception:  # noqa: BLE001
+                n = 0
                 break
+            n = 0
             end -= 16
-        return max(end, start + 1)
+        return (max(end, start + 1), n or 0)
 
-    out: list[str] = []
+    out: list[tuple[str, int]] = []
     start = 0
     last_good = start
+    last_good_tokens = 0
     for pos in positions:
         if pos <= start:
             continue
         try:
-            ok = count_tokens(text[start:pos]) <= max_tokens
+            n = count_tokens(text[start:pos])
+            ok = n <= max_tokens
         except Exception:  # noqa: BLE001
+            n = 0
             ok = True
         if ok:
             last_good = pos
+            last_good_tokens = n or 0
             continue
         if last_good > start:
-            out.append(text[start:last_good])
+            out.append((text[start:last_good], last_good_tokens))
             start = last_good
             last_good = start
             continue
-        end = hard_split(start)
-        out.append(text[start:end])
+        end, n = hard_split(start)
+        out.append((text[start:end], n))
         start = end
         last_good = start
 
     if start < len(text):
         tail = text[start:]
         try:
-            if count_tokens(tail) <= max_tokens:
-                out.append(tail)
+            n = count_tokens(tail)
+            if n <= max_tokens:
+                out.append((tail, n or 0))
             else:
                 while start < len(text):
-                    end = hard_split(start)
-                    out.append(text[start:end])
+                    end, n = hard_split(start)
+                    out.append((text[start:end], n))
                     start = end
         except Exception:  # noqa: BLE001
-            out.append(tail)
+            out.append((tail, 0))
 
-    return [seg for seg in out if seg is not None and seg != ""]
+    return [(seg, n) for seg, n in out if seg is not None and seg != ""]
 
 
 def _detect_stitch_duplicate_chunks(src_chunks: list[str], out_chunks: list[str]) -> bool:
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
+import threading
 import zipfile
 from dataclasses import dataclass
 from pathlib import Path
+from typing import IO
 
 from lxml import etree
 
@@ -29,10 +32,23 @@ def _detect_standalone(xml_bytes: bytes) -> bool | None:
     return None
 
 
+# Parsers are reusable; building one per part costs more than parsing a small part. lxml
+# parsers must not be shared between threads, so each thread keeps its own.
+# No OOXML lookup goes through xml:id, so skip the ID hash table too.
+_PARSER_LOCAL = threading.local()
+
+
+def _xml_parser() -> etree.XMLParser:
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = etree.XMLParser(resolve_entities=False, huge_tree=True, recover=False, collect_ids=False)
+        _PARSER_LOCAL.parser = parser
+    return parser
+
+
 def parse_xml_part(name: str, xml_bytes: bytes) -> XmlPart:
     try:
-        parser = etree.XMLParser(resolve_entities=False, huge_tree=True, recover=False)
-        root = etree.fromstring(xml_bytes, parser=parser)
+        root = etree.fromstring(xml_bytes, parser=_xml_parser())
     except Exception as exc:  # noqa: BLE001
         raise DocxParseError(f"Failed to parse XML part {name}: {exc}") from exc
 
@@ -40,6 +56,15 @@ def parse_xml_part(name: str, xml_bytes: bytes) -> XmlPart:
     return XmlPart(name=name, xml_bytes=xml_bytes, tree=etree.ElementTree(root), standalone=standalone)
 
 
+def parse_xml_stream(name: str, fh: IO[bytes]) -> etree._ElementTree:
+    # For read-only consumers: libxml2 parses while the zip member inflates, without holding
+    # the decompressed bytes (XmlPart keeps them for standalone detection and rewriting).
+    try:
+        return etree.parse(fh, parser=_xml_parser())
+    except Exception as exc:  # noqa: BLE001
+        raise DocxParseError(f"Failed to parse XML part {name}: {exc}") from exc
+
+
 def serialize_xml_part(part: XmlPart) -> bytes:
     root = part.tree.getroot()
     return etree.tostring(
@@ -57,25 +82,107 @@ def structure_hash(
     attr_pairs: set[tuple[str, str]] | None = None,
 ) -> str:
     root = tree.getroot()
-    cloned = etree.fromstring(etree.tostring(root, encoding="UTF-8"))
+    cloned = etree.fromstring(etree.tostring(root, encoding="UTF-8"), parser=_xml_parser())
     cloned_tree = etree.ElementTree(cloned)
 
-    for elem in cloned_tree.iter():
-        tag = etree.QName(elem).text
+    # Element tags and attribute names are already Clark "{ns}local" strings; no QName round trip.
+    for elem in cloned_tree.iter(etree.Element):
+        tag = elem.tag
         if tag in text_qnames:
             elem.text = ""
-        for attr_name in list(elem.attrib.keys()):
-            qn = etree.QName(attr_name).text
+        if not elem.attrib:
+            continue
+        for qn in list(elem.attrib.keys()):
             if qn in attr_qnames:
-                del elem.attrib[attr_name]
+                del elem.attrib[qn]
                 continue
             if attr_pairs is not None and (tag, qn) in attr_pairs:
-                elem.attrib[attr_name] = ""
+                elem.attrib[qn] = ""
 
     canonical = etree.tostring(cloned_tree, method="c14n")
     return hashlib.sha256(canonical).hexdigest()
 
 
+def _stream_node_record(node: etree._Element) -> tuple:
+    if isinstance(node.tag, str):
+        return (node.tail,)
+    # Comments, PIs and entity references never get an end event of their own.
+    return (etree.tostring(node, with_tail=False), node.tail)
+
+
+def structure_hash_stream(
+    name: str,
+    source: IO[bytes],
+    *,
+    text_qnames: set[str],
+    attr_qnames: set[str],
+    attr_pairs: set[tuple[str, str]] | None = None,
+) -> str:
+    # Same masking as structure_hash, but over one forward iterparse pass: each element is
+    # folded into the digest on its end event and then dropped, so only the open path stays
+    # alive. The digest is not comparable with structure_hash; hash both sides with one.
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        for event, elem in etree.iterparse(
+            source,
+            events=("start-ns", "end"),
+            resolve_entities=False,
+            huge_tree=True,
+            collect_ids=False,
+        ):
+            if event == "start-ns":
+                digest.update(repr(("ns", *elem)).encode("utf-8"))
+                continue
+            tag = elem.tag
+            attrs = []
+            for qn, val in elem.attrib.items():
+                if qn in attr_qnames:
+                    continue
+                if attr_pairs is not None and (tag, qn) in attr_pairs:
+                    val = ""
+                attrs.append((qn, val))
+            attrs.sort()
+            # Earlier siblings are complete (tails included) once this element has ended; fold
+            # and drop them so a long run of paragraphs does not pile up under w:body.
+            parent = elem.getparent()
+            if parent is not None:
+                while parent[0] is not elem:
+                    digest.update(repr(_stream_node_record(parent[0])).encode("utf-8"))
+                    del parent[0]
+            # Anything left under elem (its last child, trailing comments/PIs) is final too.
+            children = [_stream_node_record(child) for child in elem]
+            text = "" if tag in text_qnames else elem.text
+            digest.update(repr((tag, attrs, text, children)).encode("utf-8"))
+            del elem[:]
+    except Exception as exc:  # noqa: BLE001
+        raise DocxParseError(f"Failed to parse XML part {name}: {exc}") from exc
+    return digest.hexdigest()
+
+
+class _MappedFile(mmap.mmap):
+    # ZipFile's shared member reader asks for seekable(), which mmap only grew in 3.13.
+    def seekable(self) -> bool:
+        return True
+
+
+class _MappedZipFile(zipfile.ZipFile):
+    # ZipFile never closes a file object it was handed; release the mapping with the archive
+    # so `with read_docx_mapped(...)` unlocks the .docx (Windows) as soon as the block exits.
+    def __init__(self, mapping: _MappedFile) -> None:
+        self._mapping = mapping
+        try:
+            super().__init__(mapping, "r")
+        except BaseException:
+            mapping.close()
+            raise
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._mapping.close()
+
+
 def read_docx(path: Path) -> zipfile.ZipFile:
     try:
         return zipfile.ZipFile(path, "r")
@@ -83,6 +190,21 @@ def read_docx(path: Path) -> zipfile.ZipFile:
         raise DocxParseError(f"Failed to read docx: {exc}") from exc
 
 
+def read_docx_mapped(path: Path) -> zipfile.ZipFile:
+    # For short read-only tools: member reads come from a read-only mapping instead of
+    # seek+read syscalls. Not for the pipeline, which holds its input open for the whole run
+    # (a mapped file rewritten underneath raises SIGBUS, and Windows locks it against saves).
+    try:
+        with open(path, "rb") as fh:
+            mapping = _MappedFile(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return read_docx(path)  # missing or empty file: let ZipFile report it
+    try:
+        return _MappedZipFile(mapping)
+    except Exception as exc:  # noqa: BLE001
+        raise DocxParseError(f"Failed to read docx: {exc}") from exc
+
+
 def write_docx(input_zip: zipfile.ZipFile, output_path: Path, replacements: dict[str, bytes]) -> None:
     with zipfile.ZipFile(output_path, "w") as zout:
         for info in input_zip.infolist():
@@ -96,6 +96,45 @@ def _find_run_ancestor(node: etree._Element, qname: str) -> etree._Element | Non
     return run
 
 
+# Non-text nodes that still contribute to a paragraph's surface: tag -> (atom kind, sentinel).
+_W_MARKERS = {
+    f"{_W}tab": ("TAB", TAB),
+    f"{_W}br": ("BR", BR),
+    f"{_W}cr": ("BR", BR),
+    f"{_W}noBreakHyphen": ("NBH", NBH),
+    f"{_W}softHyphen": ("SHY", SHY),
+}
+_A_MARKERS = {
+    f"{_A}tab": ("TAB", TAB),
+    f"{_A}br": ("BR", BR),
+}
+
+
+def _paragraph_surface(p: etree._Element, text_tag: str, markers: dict[str, tuple[str, str]]) -> str | None:
+    parts: list[str] = []
+    has_text = False
+    for node in p.iter():
+        if node.tag == text_tag:
+            text = node.text or ""
+            parts.append(text)
+            has_text = has_text or bool(text.strip())
+        else:
+            marker = markers.get(node.tag)
+            if marker is not None:
+                parts.append(marker[1])
+    return "".join(parts) if has_text else None
+
+
+def w_paragraph_surface(p: etree._Element) -> str | None:
+    # surface_text of the scope extract_scopes_from_xml builds for this w:p, or None when it
+    # builds none; lets read-only tools skip atoms, spans and style signatures.
+    return _paragraph_surface(p, f"{_W}t", _W_MARKERS)
+
+
+def a_paragraph_surface(p: etree._Element) -> str | None:
+    return _paragraph_surface(p, f"{_A}t", _A_MARKERS)
+
+
 def _build_spans(atoms: list[Atom]) -> list[FormatSpan]:
     spans: list[FormatSpan] = []
     current_style = None
@@ -148,14 +187,10 @@ def extract_scopes_from_xml(part_name: str, tree: etree._ElementTree) -> list[Sc
                     part_name=part_name, kind="w:t", element=node, attr_name=None, original_text=text
                 )
                 atoms.append(Atom(kind="TEXT", node_ref=node_ref, value=text, style_sig=style_sig))
-            elif node.tag == f"{_W}tab":
-                atoms.append(Atom(kind="TAB", node_ref=None, value=TAB, style_sig=""))
-            elif node.tag in {f"{_W}br", f"{_W}cr"}:
-                atoms.append(Atom(kind="BR", node_ref=None, value=BR, style_sig=""))
-            elif node.tag == f"{_W}noBreakHyphen":
-                atoms.append(Atom(kind="NBH", node_ref=None, value=NBH, style_sig=""))
-            elif node.tag == f"{_W}softHyphen":
-                atoms.append(Atom(kind="SHY", node_ref=None, value=SHY, style_sig=""))
+            else:
+                marker = _W_MARKERS.get(node.tag)
+                if marker is not None:
+                    atoms.append(Atom(kind=marker[0], node_ref=None, value=marker[1], style_sig=""))
 
         if not any(atom.kind == "TEXT" and atom.value.strip() for atom in atoms):
             continue
@@ -177,10 +212,10 @@ def extract_scopes_from_xml(part_name: str, tree: etree._ElementTree) -> list[Sc
                     part_name=part_name, kind="a:t", element=node, attr_name=None, original_text=text
                 )
                 atoms.append(Atom(kind="TEXT", node_ref=node_ref, value=text, style_sig=style_sig))
-            elif node.tag == f"{_A}tab":
-                atoms.append(Atom(kind="TAB", node_ref=None, value=TAB, style_sig=""))
-            elif node.tag == f"{_A}br":
-                atoms.append(Atom(kind="BR", node_ref=None, value=BR, style_sig=""))
+            else:
+                marker = _A_MARKERS.get(node.tag)
+                if marker is not None:
+                    atoms.append(Atom(kind=marker[0], node_ref=None, value=marker[1], style_sig=""))
 
         if not any(atom.kind == "TEXT" and atom.value.strip() for atom in atoms):
             continue
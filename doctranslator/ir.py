@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Callable, Literal, TypeVar
 
 from lxml import etree
 
 
 TextNodeKind = Literal["w:t", "a:t", "attr"]
 
+_T = TypeVar("_T")
+
 
 @dataclass(frozen=True)
 class TextNodeRef:
@@ -53,3 +55,14 @@ class TranslationUnit:
     ws_flags: list[str] = field(default_factory=list)
     qe_score: int | None = None
     qe_flags: list[str] = field(default_factory=list)
+    _derived: dict[str, tuple[str, object]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def derived(self, key: str, surface: str, compute: Callable[[str], _T]) -> _T:
+        # Memoize values computed from one of the (immutable) surfaces; an entry is reused only
+        # while it was computed from the very same string object.
+        hit = self._derived.get(key)
+        if hit is not None and hit[0] is surface:
+            return hit[1]  # type: ignore[return-value]
+        value = compute(surface)
+        self._derived[key] = (surface, value)
+        return value
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import re
 from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from doctranslator.errors import ModelLoadError
 
 _DEFAULT_REPEAT_PENALTY = 1.10
+# A decode whose tail is one character repeated this many times is looping; quality checks would
+# reject it anyway (repeated_char_run), so stop generating instead of running to max_tokens.
+_RUNAWAY_RUN = 64
+_RUNAWAY_RUN_RE = re.compile(r"(.)\1{%d,}" % (_RUNAWAY_RUN - 1), flags=re.DOTALL)
 
 
 def _ensure_custom_chat_formats_registered() -> None:
@@ -100,6 +105,21 @@ def _init_llama(llama_cls: Any, kwargs: dict[str, Any]) -> Any:
         raise
 
 
+def _attach_prompt_cache(llm: Any, cache_mb: int) -> None:
+    # The agent alternates between prompts that share the document-level context block
+    # (instruction JSON, plain translate, review); a RAM cache keeps several KV prefixes alive
+    # so each call only prefills the per-TU tail instead of the whole prompt.
+    if cache_mb <= 0 or not hasattr(llm, "set_cache"):
+        return
+    try:
+        from llama_cpp import LlamaRAMCache  # type: ignore[import-not-found]
+
+        llm.set_cache(LlamaRAMCache(capacity_bytes=int(cache_mb) << 20))
+    except Exception:  # noqa: BLE001
+        # Optional speed-up only; never fail model loading over it.
+        return
+
+
 def _safe_tokenize(llm: Any, text: str) -> list[int]:
     if not text:
         return []
@@ -120,6 +140,24 @@ def _safe_tokenize(llm: Any, text: str) -> list[int]:
     return []
 
 
+def _drain_stream(chunks: Any, piece: Callable[[dict[str, Any]], Any]) -> str:
+    parts: list[str] = []
+    tail = ""
+    for chunk in chunks:
+        choice0 = (chunk.get("choices") or [{}])[0]
+        text = piece(choice0)
+        if not isinstance(text, str) or not text:
+            continue
+        parts.append(text)
+        tail = (tail + text)[-_RUNAWAY_RUN:]
+        if len(tail) == _RUNAWAY_RUN and tail.count(tail[0]) == _RUNAWAY_RUN:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+            break
+    return "".join(parts)
+
+
 def _llama_chat(
     llm: Any,
     prompt: str,
@@ -130,6 +168,7 @@ def _llama_chat(
     top_k: int | None = None,
     stop: list[str] | None = None,
     repeat_penalty: float | None = None,
+    abort_on_runaway: bool = False,
 ) -> str | None:
     if not hasattr(llm, "create_chat_completion"):
         return None
@@ -146,6 +185,8 @@ def _llama_chat(
             kwargs["stop"] = stop
         if repeat_penalty is not None:
             kwargs["repeat_penalty"] = float(repeat_penalty)
+        if abort_on_runaway:
+            kwargs["stream"] = True
         try:
             out = llm.create_chat_completion(**kwargs)
         except TypeError:
@@ -155,6 +196,8 @@ def _llama_chat(
             except TypeError:
                 kwargs.pop("stop", None)
                 out = llm.create_chat_completion(**kwargs)
+        if abort_on_runaway:
+            return _drain_stream(out, lambda c: (c.get("delta") or {}).get("content")).strip()
         choice0 = (out.get("choices") or [{}])[0]
         msg = choice0.get("message") or {}
         content = msg.get("content")
@@ -173,6 +216,7 @@ def _llama_complete(
     top_k: int | None = None,
     stop: list[str] | None = None,
     repeat_penalty: float | None = None,
+    abort_on_runaway: bool = False,
 ) -> str:
     kwargs: dict[str, Any] = {"max_tokens": max_tokens, "temperature": temperature, "top_p": top_p}
     if top_k is not None:
@@ -181,6 +225,8 @@ def _llama_complete(
         kwargs["stop"] = stop
     if repeat_penalty is not None:
         kwargs["repeat_penalty"] = float(repeat_penalty)
+    if abort_on_runaway:
+        kwargs["stream"] = True
     try:
         out = llm(prompt, **kwargs)
     except TypeError:
@@ -189,6 +235,8 @@ def _llama_complete(
             out = llm(prompt, **kwargs)
         except TypeError:
             out = llm(prompt, max_tokens=max_tokens)
+    if abort_on_runaway and not isinstance(out, dict):
+        return _drain_stream(out, lambda c: c.get("text")).strip()
     choice0 = (out.get("choices") or [{}])[0]
     text = choice0.get("text")
     if isinstance(text, str):
@@ -255,6 +303,7 @@ class ChatModel:
         seed: int,
         verbose: bool,
         chat_format: str | None = None,
+        prompt_cache_mb: int = 0,
     ) -> "ChatModel":
         if not model_path.exists():
             raise ModelLoadError(f"Model file not found: {model_path}")
@@ -273,6 +322,7 @@ class ChatModel:
             llm = _init_llama(Llama, kwargs)
         except Exception as exc:  # noqa: BLE001
             raise ModelLoadError(f"Failed to load GGUF model from {model_path}: {exc}") from exc
+        _attach_prompt_cache(llm, prompt_cache_mb)
         return ChatModel(
             model_path=model_path,
             llm=llm,
@@ -342,6 +392,7 @@ class TranslateGemmaModel:
         seed: int,
         verbose: bool,
         chat_format: str | None = None,
+        prompt_cache_mb: int = 0,
     ) -> "TranslateGemmaModel":
         if not model_path.exists():
             raise ModelLoadError(f"Model file not found: {model_path}")
@@ -360,6 +411,7 @@ class TranslateGemmaModel:
             llm = _init_llama(Llama, kwargs)
         except Exception as exc:  # noqa: BLE001
             raise ModelLoadError(f"Failed to load GGUF model from {model_path}: {exc}") from exc
+        _attach_prompt_cache(llm, prompt_cache_mb)
         return TranslateGemmaModel(
             model_path=model_path,
             llm=llm,
@@ -408,6 +460,8 @@ class TranslateGemmaModel:
                     is_hy_mt = True
         except Exception:  # noqa: BLE001
             pass
+        # Stream so a looping decode can be cut short; only when the source has no such run itself.
+        abort_on_runaway = _RUNAWAY_RUN_RE.search(text) is None
 
         src = source_lang_code.strip().lower()
         tgt = target_lang_code.strip().lower()
@@ -585,6 +639,7 @@ class TranslateGemmaModel:
                 top_k=top_k,
                 stop=stop,
                 repeat_penalty=repeat_penalty,
+                abort_on_runaway=abort_on_runaway,
             )
             if chat is not None:
                 return chat
@@ -597,6 +652,7 @@ class TranslateGemmaModel:
                 top_k=top_k,
                 stop=stop,
                 repeat_penalty=repeat_penalty,
+                abort_on_runaway=abort_on_runaway,
             )
 
         ctx_block = ""
@@ -623,11 +679,12 @@ class TranslateGemmaModel:
             "Preserve all Arabic digits (0-9) from the source exactly; do not invent any digits.\n"
             "Do NOT spell out digits using words (e.g., 7 -> 七 or seven is NOT allowed).\n"
             "If the source contains references like \"Section 7\" / \"Article 7\", translate naturally but keep the digit 7 (e.g., \"第7条\").\n\n"
-            + (nums_line + "\n" if nums_line else "")
             + (("Agent instruction (highest priority):\n" + str(agent_instruction).strip() + "\n\n") if agent_instruction else "")
             + "If CONTEXT is provided, use it ONLY to disambiguate; do NOT translate the CONTEXT blocks.\n\n"
         )
-        text_block = "Text to translate:\n" + f"{text}\n"
+        # Per-segment lines go last: llama.cpp reuses the KV cache for the longest prompt prefix
+        # shared with the previous call, so consecutive segments only prefill what differs.
+        text_block = (nums_line + "\n" if nums_line else "") + "Text to translate:\n" + f"{text}\n"
 
         # Keep output room; drop low-priority context chunks if prompt would exceed n_ctx.
         reserved_out = max(128, min(int(max_new_tokens), int(self.n_ctx) // 3))
@@ -675,6 +732,7 @@ class TranslateGemmaModel:
             top_k=top_k,
             stop=stop,
             repeat_penalty=repeat_penalty,
+            abort_on_runaway=abort_on_runaway,
         )
         if chat is not None:
             return chat
@@ -687,6 +745,7 @@ class TranslateGemmaModel:
             top_k=top_k,
             stop=stop,
             repeat_penalty=repeat_penalty,
+            abort_on_runaway=abort_on_runaway,
         )
 
 
@@ -73,6 +73,7 @@ class DocxTranslationPipeline:
             seed=self.settings.llama_seed,
             verbose=self.settings.llama_verbose,
             chat_format=chat_format,
+            prompt_cache_mb=self.settings.llama_prompt_cache_mb,
         )
         return self._translategemma
 
@@ -91,6 +92,7 @@ class DocxTranslationPipeline:
             seed=self.settings.llama_seed,
             verbose=self.settings.llama_verbose,
             chat_format=self.settings.llama_chat_format_gemma,
+            prompt_cache_mb=self.settings.llama_prompt_cache_mb,
         )
         return self._gemma3_12b
 
@@ -196,7 +198,7 @@ class DocxTranslationPipeline:
                 para_contexts = None
 
             if para_contexts:
-                paragraphs = sum(1 for t in tus if _scope_type(t.scope_key) == "w:p")
+                paragraphs = sum(1 for t in tus if "#w:p@" in t.scope_key)
                 headings = sum(1 for c in para_contexts.values() if c.is_heading)
                 list_paragraphs = sum(1 for c in para_contexts.values() if c.list_level is not None)
                 in_table = sum(1 for c in para_contexts.values() if c.in_table)
@@ -273,7 +275,7 @@ class DocxTranslationPipeline:
                 preferred = [
                     tu
                     for tu in tus
-                    if tu.part_name.endswith("word/document.xml") and _scope_type(tu.scope_key) == "w:p"
+                    if tu.part_name.endswith("word/document.xml") and "#w:p@" in tu.scope_key
                 ]
                 base = preferred if preferred else tus
                 excerpts = [tu.source_surface for tu in base[: self.settings.context_max_excerpts]]
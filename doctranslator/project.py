@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import heapq
 import re
 from dataclasses import dataclass
 
 from doctranslator.freezer import unfreeze_text
 from doctranslator.ir import FormatSpan, TextNodeRef
-from doctranslator.sentinels import CONTROL_TOKENS, control_tokens_from_text
+from doctranslator.sentinels import CONTROL_TOKEN_RE, CONTROL_TOKENS, control_tokens_from_text
 
 
 _TOKEN_RE = re.compile(r"⟦[^⟧]+⟧")
@@ -20,10 +21,9 @@ class SpanSlice:
 def _split_by_control_sequence(text: str) -> list[str]:
     if not text:
         return [""]
-    pattern = re.compile("|".join(re.escape(tok) for tok in CONTROL_TOKENS))
     parts: list[str] = []
     pos = 0
-    for m in pattern.finditer(text):
+    for m in CONTROL_TOKEN_RE.finditer(text):
         parts.append(text[pos : m.start()])
         parts.append(m.group(0))
         pos = m.end()
@@ -63,10 +63,10 @@ def _allocate_plain_counts(total_plain: int, weights: list[int]) -> list[int]:
 
     raw = [total_plain * w / total_w for w in weights]
     floored = [int(x) for x in raw]
+    # Largest-remainder (Hamilton) rounding: the leftover is the sum of the fractional parts,
+    # so it is always < len(weights) and each of the top-`remain` indices gets exactly one.
     remain = total_plain - sum(floored)
-    frac = sorted([(raw[i] - floored[i], i) for i in range(len(weights))], reverse=True)
-    for k in range(remain):
-        _, idx = frac[k % len(frac)]
+    for _, idx in heapq.nlargest(remain, ((raw[i] - floored[i], i) for i in range(len(weights)))):
         floored[idx] += 1
     return floored
 
@@ -104,9 +104,23 @@ def project_translation_to_spans(
                 raise ValueError("Translated text exists for empty source block")
             continue
 
+        weights = [max(len(span.source_text), 1) for span in block_spans]
+
+        if _TOKEN_RE.search(tgt_part) is None:
+            # Token-free block (the common case): every unit is one character, so slice the
+            # string directly. Mirrors the unit walk below, where each non-final span takes at
+            # least one unit before advancing and the final span takes the remainder.
+            desired = _allocate_plain_counts(len(tgt_part), weights)
+            last = len(block_spans) - 1
+            pos = 0
+            for k, span in enumerate(block_spans):
+                end = len(tgt_part) if k == last else min(len(tgt_part), pos + max(desired[k], 1))
+                span_slices.append(SpanSlice(span=span, text=unfreeze_text(tgt_part[pos:end], nt_map)))
+                pos = end
+            continue
+
         tgt_units = _unitize(tgt_part)
         total_plain = _count_plain_units(tgt_units)
-        weights = [max(len(span.source_text), 1) for span in block_spans]
         desired = _allocate_plain_counts(total_plain, weights)
 
         slices_units: list[list[str]] = [[] for _ in block_spans]
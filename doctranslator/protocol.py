@@ -12,7 +12,12 @@ from doctranslator.textutil import (
     _LATIN_RE,
     _NUMBER_TOKEN_RE,
     _NUMBER_VALUE_RE,
+    _count_number_tokens,
+    _glossary_items_by_key_len,
+    _icase_pat,
+    _source_plain,
     _text_for_lang,
+    number_tokens_in_text,
 )
 
 
@@ -21,14 +26,15 @@ _REPEAT_CHAR_RE = re.compile(r"(.)\\1{12,}")
 
 # NOTE: Do not include raw tab (\u0009) here. Tabs must be represented by the explicit sentinel token ⟦TAB⟧.
 _WEIRD_WS_RE = re.compile(r"[\u000B\u000C\u00A0\u2000-\u200A\u202F\u205F\u3000\uFEFF]")
+# Same code points as _WEIRD_WS_RE, mapped to a plain space via str.translate (no regex engine per char).
+_WEIRD_WS_TABLE = {cp: 0x20 for cp in (0x0B, 0x0C, 0xA0, *range(0x2000, 0x200B), 0x202F, 0x205F, 0x3000, 0xFEFF)}
 _CJK_INNER_SPACE_RE = re.compile(r"(?<=[\u4e00-\u9fff])\s+(?=[\u4e00-\u9fff])")
 _EDGE_WS_RE = re.compile(r"^(\s*)(.*?)(\s*)$", flags=re.DOTALL)
 _MULTI_SPACE_RE = re.compile(r"[ ]{2,}")
-_ZH_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([，。！？；：、）】》」』])")
-_ZH_SPACE_AFTER_OPEN_PUNCT_RE = re.compile(r"([（【《「『])\s+")
-_EN_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([,.;:!?])")
-_EN_SPACE_AFTER_OPEN_PUNCT_RE = re.compile(r"([(\[{])\s+")
-_EN_SPACE_BEFORE_CLOSE_PUNCT_RE = re.compile(r"\s+([)\]}])")
+# Drop whitespace before closing punctuation or after opening punctuation in one scan.
+# Replace with r"\g<open>\g<close>": exactly one of the groups participates in each match.
+_ZH_SPACE_PUNCT_RE = re.compile(r"\s+(?P<close>[，。！？；：、）】》」』])|(?P<open>[（【《「『])\s+")
+_EN_SPACE_PUNCT_RE = re.compile(r"\s+(?P<close>[,.;:!?)\]}])|(?P<open>[(\[{])\s+")
 
 
 _UNEXPECTED_SCRIPT_CHAR_RE = re.compile(
@@ -78,6 +84,19 @@ def _split_edge_ws(text: str) -> tuple[str, str, str]:
     return (m.group(1), m.group(2), m.group(3))
 
 
+def _frozen_control_tokens(tu: TranslationUnit) -> list[str]:
+    return tu.derived("frozen_control_tokens", tu.frozen_surface, control_tokens_from_text)
+
+
+def _frozen_parts(tu: TranslationUnit) -> list[str]:
+    return tu.derived("frozen_parts", tu.frozen_surface, _split_by_sentinels)
+
+
+def _source_number_counts(tu: TranslationUnit) -> Counter[str]:
+    # Shared memo: callers must not mutate the returned Counter.
+    return tu.derived("source_number_counts", tu.source_surface, number_tokens_in_text)
+
+
 def _strip_unexpected_sentinels(text: str, allowed: set[str]) -> str:
     if not text:
         return ""
@@ -97,7 +116,7 @@ def _strip_unexpected_scripts_for_tu(
     if not (target_lang or "").lower().startswith("zh"):
         return (translated, False)
 
-    src_plain = ANY_SENTINEL_RE.sub(" ", tu.source_surface)
+    src_plain = _source_plain(tu)
     allowed_chars = set(_UNEXPECTED_SCRIPT_CHAR_RE.findall(src_plain))
 
     parts = _split_by_sentinels(translated)
@@ -110,6 +129,10 @@ def _strip_unexpected_scripts_for_tu(
         if not part:
             out_parts.append(part)
             continue
+        # Nothing to strip: ASCII can never match, and one search settles the rest.
+        if part.isascii() or _UNEXPECTED_SCRIPT_CHAR_RE.search(part) is None:
+            out_parts.append(part)
+            continue
         if not allowed_chars:
             new = _UNEXPECTED_SCRIPT_CHAR_RE.sub("", part)
         else:
@@ -129,7 +152,7 @@ def _strip_unexpected_scripts_for_tu(
 def _normalize_model_output(text: str) -> str:
     if not text:
         return ""
-    text = _WEIRD_WS_RE.sub(" ", text)
+    text = text.translate(_WEIRD_WS_TABLE)
     # IMPORTANT: do not normalize raw newlines/tabs here. Those are protocol violations and must be
     # repaired deterministically or rejected by validation (never silently "accepted").
     text = _CJK_INNER_SPACE_RE.sub("", text)
@@ -141,7 +164,7 @@ def _normalize_sentinel_edge_whitespace_to_source(tu: TranslationUnit, translate
     if not translated:
         return translated
 
-    src_parts = _split_by_sentinels(tu.frozen_surface)
+    src_parts = _frozen_parts(tu)
     tgt_parts = _split_by_sentinels(translated)
     if len(src_parts) != len(tgt_parts):
         return translated
@@ -195,24 +218,17 @@ def _normalize_inner_whitespace_for_lang(
                 flags.append("cjk_inner_space")
                 cur = _CJK_INNER_SPACE_RE.sub("", cur)
 
-            if _ZH_SPACE_BEFORE_PUNCT_RE.search(cur) or _ZH_SPACE_AFTER_OPEN_PUNCT_RE.search(cur):
+            cur, n_punct = _ZH_SPACE_PUNCT_RE.subn(r"\g<open>\g<close>", cur)
+            if n_punct:
                 flags.append("space_punct")
-            cur = _ZH_SPACE_BEFORE_PUNCT_RE.sub(r"\1", cur)
-            cur = _ZH_SPACE_AFTER_OPEN_PUNCT_RE.sub(r"\1", cur)
         else:
             if _MULTI_SPACE_RE.search(cur):
                 flags.append("multi_space")
                 cur = _MULTI_SPACE_RE.sub(" ", cur)
 
-            if (
-                _EN_SPACE_BEFORE_PUNCT_RE.search(cur)
-                or _EN_SPACE_AFTER_OPEN_PUNCT_RE.search(cur)
-                or _EN_SPACE_BEFORE_CLOSE_PUNCT_RE.search(cur)
-            ):
+            cur, n_punct = _EN_SPACE_PUNCT_RE.subn(r"\g<open>\g<close>", cur)
+            if n_punct:
                 flags.append("space_punct")
-            cur = _EN_SPACE_BEFORE_PUNCT_RE.sub(r"\1", cur)
-            cur = _EN_SPACE_AFTER_OPEN_PUNCT_RE.sub(r"\1", cur)
-            cur = _EN_SPACE_BEFORE_CLOSE_PUNCT_RE.sub(r"\1", cur)
 
         if cur != core:
             changed = True
@@ -258,8 +274,8 @@ def _sanitize_number_tokens_to_match_source(tu: TranslationUnit, translated: str
     if not translated:
         return translated
 
-    src_plain = ANY_SENTINEL_RE.sub(" ", tu.source_surface)
-    required = Counter(_NUMBER_TOKEN_RE.findall(src_plain))
+    src_plain = _source_plain(tu)
+    required = _source_number_counts(tu)
 
     # Count digits contributed by NT tokens already present in the output.
     nt_contrib: Counter[str] = Counter()
@@ -303,7 +319,7 @@ def _sanitize_number_tokens_to_match_source(tu: TranslationUnit, translated: str
     def count_numbers_after(text: str) -> Counter[str]:
         tgt_unfrozen = unfreeze_text(text, tu.nt_map)
         tgt_plain = ANY_SENTINEL_RE.sub(" ", tgt_unfrozen)
-        return Counter(_NUMBER_TOKEN_RE.findall(tgt_plain))
+        return _count_number_tokens(tgt_plain)
 
     cur = count_numbers_after(out)
     missing = required - cur
@@ -425,7 +441,7 @@ def _fix_reference_placeholders(tu: TranslationUnit, translated: str, target_lan
     if not (target_lang or "").lower().startswith("zh"):
         return (translated, False)
 
-    src_plain = ANY_SENTINEL_RE.sub(" ", tu.source_surface)
+    src_plain = _source_plain(tu)
     required_numbers = list(dict.fromkeys(_NUMBER_TOKEN_RE.findall(src_plain)))
     if not required_numbers:
         return (translated, False)
@@ -452,18 +468,26 @@ def _fix_reference_placeholders(tu: TranslationUnit, translated: str, target_lan
     return ("".join(out_parts), changed)
 
 
-def _validate_sentinels(tu: TranslationUnit, translated: str) -> None:
+def _validate_sentinels(
+    tu: TranslationUnit,
+    translated: str,
+    *,
+    plain_src: str | None = None,
+    plain_out: str | None = None,
+) -> None:
     if "\r" in translated or "\n" in translated:
         raise TranslationProtocolError(f"Raw newline characters found in TU {tu.tu_id}")
     if "\t" in translated:
         raise TranslationProtocolError(f"Raw tab characters found in TU {tu.tu_id}")
-    if control_tokens_from_text(tu.frozen_surface) != control_tokens_from_text(translated):
+    # One sentinel scan of the candidate serves every check below; matches never overlap,
+    # so filtering it yields exactly what the per-kind regexes would find.
+    found = ANY_SENTINEL_RE.findall(translated) if "<<MT_" in translated else []
+    if _frozen_control_tokens(tu) != [token for token in found if token in CONTROL_TOKENS]:
         raise TranslationProtocolError(f"Control tokens mismatch for TU {tu.tu_id}")
 
     numeric_nt = {token for token, original in tu.nt_map.items() if _NUMBER_VALUE_RE.fullmatch(original) is not None}
     expected_nt = set(tu.nt_map.keys()) - numeric_nt
-    found_nt = NT_RE.findall(translated)
-    found_nt_tokens = {f"⟦NT:{n}⟧" for n in found_nt}
+    found_nt_tokens = {f"⟦NT:{token[8:-2]}⟧" for token in found if token.startswith("<<MT_NT:")}
     found_nt_non_numeric = found_nt_tokens - numeric_nt
     if expected_nt != found_nt_non_numeric:
         missing = len(expected_nt - found_nt_non_numeric)
@@ -474,17 +498,14 @@ def _validate_sentinels(tu: TranslationUnit, translated: str) -> None:
         if translated.count(token) != 1:
             raise TranslationProtocolError(f"NT placeholder count != 1 for TU {tu.tu_id}")
 
-    for token in ANY_SENTINEL_RE.findall(translated):
-        if token in CONTROL_TOKENS:
-            continue
-        if NT_RE.fullmatch(token):
+    for token in found:
+        if token in CONTROL_TOKENS or token.startswith("<<MT_NT:"):
             continue
         raise TranslationProtocolError(f"Unexpected sentinel token in TU {tu.tu_id}")
 
-    src_plain = ANY_SENTINEL_RE.sub(" ", tu.source_surface)
-    tgt_unfrozen = unfreeze_text(translated, tu.nt_map)
-    tgt_plain = ANY_SENTINEL_RE.sub(" ", tgt_unfrozen)
-    if Counter(_NUMBER_TOKEN_RE.findall(src_plain)) != Counter(_NUMBER_TOKEN_RE.findall(tgt_plain)):
+    src_numbers = _count_number_tokens(plain_src) if plain_src is not None else _source_number_counts(tu)
+    tgt_plain = plain_out if plain_out is not None else ANY_SENTINEL_RE.sub(" ", unfreeze_text(translated, tu.nt_map))
+    if src_numbers != _count_number_tokens(tgt_plain):
         raise TranslationProtocolError(f"Number tokens mismatch for TU {tu.tu_id}")
 
 
@@ -492,7 +513,7 @@ def _repair_raw_controls_to_match_source(tu: TranslationUnit, text: str) -> str:
     if not text:
         return ""
 
-    expected = control_tokens_from_text(tu.frozen_surface)
+    expected = _frozen_control_tokens(tu)
     exp_counts = Counter(expected)
     cur_counts = Counter(control_tokens_from_text(text))
 
@@ -542,7 +563,10 @@ def _repair_raw_controls_to_match_source(tu: TranslationUnit, text: str) -> str:
 def _strip_prompt_artifacts_if_unexpected(tu: TranslationUnit, translated: str) -> str:
     if not translated:
         return translated
-    src_plain = ANY_SENTINEL_RE.sub(" ", tu.source_surface)
+    # Every prompt tag needs "[" and every prompt key needs ":"; skip both regexes otherwise.
+    if "[" not in translated and ":" not in translated:
+        return translated
+    src_plain = _source_plain(tu)
     out_plain = ANY_SENTINEL_RE.sub(" ", translated)
     if (_PROMPT_TAG_RE.search(out_plain) or _PROMPT_KV_RE.search(out_plain)) and (
         _PROMPT_TAG_RE.search(src_plain) is None and _PROMPT_KV_RE.search(src_plain) is None
@@ -595,14 +619,13 @@ def _glossary_lines_for_text(glossary: dict[str, str] | None, *, text: str, max_
     src_plain = ANY_SENTINEL_RE.sub(" ", text)
     matched: list[tuple[str, str]] = []
     # Prefer longer source terms first to avoid partial overlaps.
-    items = sorted(glossary.items(), key=lambda kv: len(str(kv[0])), reverse=True)
-    for k, v in items:
+    for k, v in _glossary_items_by_key_len(glossary):
         ks = str(k).strip()
         vs = str(v).strip()
         if not ks or not vs:
             continue
         if _LATIN_RE.search(ks):
-            if re.search(re.escape(ks), src_plain, flags=re.IGNORECASE) is None:
+            if _icase_pat(ks).search(src_plain) is None:
                 continue
         else:
             if ks not in src_plain:
@@ -1,25 +1,30 @@
 from __future__ import annotations
 
 import re
-from collections import Counter
+from dataclasses import dataclass
+from typing import Any
 
 from doctranslator.freezer import unfreeze_text
 from doctranslator.ir import TranslationUnit
-from doctranslator.sentinels import ANY_SENTINEL_RE
+from doctranslator.sentinels import _strip_sentinels
 from doctranslator.textutil import (
     _CJK_RE,
     _LATIN_RE,
-    _LATIN_EXT_RE,
+    _icase_pat,
     _looks_like_english,
     _looks_like_entity_name,
-    _text_for_lang,
+    _script_counts,
 )
 
 
+_WS_RE = re.compile(r"\s+")
 _ZERO_WIDTH_RE = re.compile(r"[\u200b\u200c\u200d\u2060]")
 _REPEAT_CHAR_RE = re.compile(r"(.)\1{12,}")
 _LATIN_PHRASE_RE = re.compile(r"[A-Za-z][A-Za-z0-9 ,.;:'\"()/\\-]{30,}")
 _LATIN_PHRASE_SHORT_RE = re.compile(r"[A-Za-z][A-Za-z0-9 ,.;:'\"()/\\-]{12,}")
+_SENT_SPLIT_RE = re.compile(r"[。！？；：.!?;:]")
+# ASCII-only text can only hit the ASCII terminators; map them to NUL for a bytes-level split.
+_ASCII_SENT_TERMINATORS = bytes.maketrans(b".!?;:", b"\x00" * 5)
 
 _UNEXPECTED_SCRIPT_CHAR_RE = re.compile(
     r"[\u0900-\u097F\u0980-\u09FF\u0600-\u06FF\u0400-\u04FF\u0370-\u03FF\u0590-\u05FF\u0E00-\u0E7F\uAC00-\uD7AF\u3040-\u309F\u30A0-\u30FF]"
@@ -46,6 +51,15 @@ _EN_COND_RE = re.compile(
     flags=re.IGNORECASE,
 )
 _ZH_COND_INJECT_RE = re.compile(r"(如果|若|如)\s*适用")
+_VAR_MARKER_RES = tuple(re.compile(rf"\b{ch}\b") for ch in ("X", "Y", "Z"))
+
+# Per-glossary EN->ZH leakage entries: (src_term, dst_term, src_term_re, word_res). Keyed by id() like
+# textutil._GLOSSARY_SORTED_CACHE; entries keep a reference to the dict so its id() cannot be recycled.
+_GlossaryLeakEntry = tuple[str, str, re.Pattern[str], tuple[re.Pattern[str], ...]]
+_GLOSSARY_EN_ZH_CACHE: dict[int, tuple[dict[str, str], list[_GlossaryLeakEntry], int, Any]] = {}
+_GLOSSARY_EN_ZH_CACHE_MAX = 8
+# Below this many entries, N `dt in out` substring checks beat one Aho-Corasick pass over the output.
+_GLOSSARY_AUTOMATON_MIN_ENTRIES = 256
 
 
 HARD_QUALITY_ISSUES: set[str] = {
@@ -73,6 +87,48 @@ HARD_QUALITY_ISSUES: set[str] = {
 }
 
 
+def _unexpected_script_chars(text: str) -> set[str]:
+    if not text or text.isascii():
+        return set()
+    return set(_UNEXPECTED_SCRIPT_CHAR_RE.findall(text))
+
+
+@dataclass(frozen=True)
+class _SourceView:
+    plain: str
+    plain_ws: str
+    low: str
+    low_has_latin: bool
+    latin: int
+    cjk: int
+    unexpected_scripts: set[str]
+
+
+def _build_source_view(source_surface: str) -> _SourceView:
+    plain = _strip_sentinels(source_surface)
+    plain_ws = _WS_RE.sub(" ", plain).strip()
+    low = plain_ws.lower()
+    latin, _latin_ext, cjk = _script_counts(plain)
+    return _SourceView(
+        plain=plain,
+        plain_ws=plain_ws,
+        low=low,
+        low_has_latin=_LATIN_RE.search(low) is not None,
+        latin=latin,
+        cjk=cjk,
+        unexpected_scripts=_unexpected_script_chars(plain),
+    )
+
+
+def _source_view(tu: TranslationUnit) -> _SourceView:
+    # Source-side views are identical on every evaluation of a TU (drafts, rewrites, repair rounds).
+    return tu.derived("quality_source_view", tu.source_surface, _build_source_view)
+
+
+def _plain_source(tu: TranslationUnit) -> str:
+    return _source_view(tu).plain
+
+
 def hard_issues(issues: list[str]) -> list[str]:
     hard: list[str] = []
     for it in issues or []:
@@ -82,6 +138,89 @@ def hard_issues(issues: list[str]) -> list[str]:
     return hard
 
 
+def _has_source_echo(plain_out: str, src_low: str, out_low: str) -> bool:
+    # Every phrase starts with an ASCII letter, so callers skip this when either side has none.
+    for m in _LATIN_PHRASE_SHORT_RE.finditer(plain_out):
+        phrase = m.group(0)
+        ph = _WS_RE.sub(" ", phrase).strip().lower()
+        if len(ph) < 12:
+            continue
+        if ph not in src_low or ph not in out_low:
+            continue
+        if _looks_like_entity_name(phrase):
+            continue
+        return True
+    return False
+
+
+def _split_sentences(text: str) -> list[str]:
+    if text.isascii() and "\x00" not in text:
+        return text.encode("ascii").translate(_ASCII_SENT_TERMINATORS).decode("ascii").split("\x00")
+    return _SENT_SPLIT_RE.split(text)
+
+
+def _has_repeated_sentence(plain_out: str) -> bool:
+    seen: set[str] = set()
+    for sent in _split_sentences(plain_out):
+        sent = _WS_RE.sub(" ", sent).strip()
+        if len(sent) < 12:
+            continue
+        if sent in seen:
+            return True
+        seen.add(sent)
+    return False
+
+
+def _import_ahocorasick() -> Any:
+    try:
+        import ahocorasick  # type: ignore[import-not-found]
+    except Exception:  # noqa: BLE001
+        return None
+    return ahocorasick
+
+
+def _build_dst_term_automaton(entries: list[_GlossaryLeakEntry]) -> Any:
+    if len(entries) < _GLOSSARY_AUTOMATON_MIN_ENTRIES:
+        return None
+    ahocorasick = _import_ahocorasick()
+    if ahocorasick is None:
+        return None
+    by_dt: dict[str, list[int]] = {}
+    for i, entry in enumerate(entries):
+        by_dt.setdefault(entry[1], []).append(i)
+    automaton = ahocorasick.Automaton()
+    for dt, idxs in by_dt.items():
+        automaton.add_word(dt, tuple(idxs))
+    automaton.make_automaton()
+    return automaton
+
+
+def _en_zh_glossary_entries(glossary: dict[str, str]) -> tuple[list[_GlossaryLeakEntry], Any]:
+    cached = _GLOSSARY_EN_ZH_CACHE.get(id(glossary))
+    if cached is not None and cached[0] is glossary and cached[2] == len(glossary):
+        return cached[1], cached[3]
+    entries: list[_GlossaryLeakEntry] = []
+    for src_term, dst_term in glossary.items():
+        st = str(src_term).strip()
+        dt = str(dst_term).strip()
+        if not st or not dt:
+            continue
+        if not _LATIN_RE.search(st) or not _CJK_RE.search(dt):
+            continue
+        words = [w.lower() for w in re.findall(r"[A-Za-z]{4,}", st)]
+        if len(words) < 2:
+            continue
+        if len(dt) < 6:
+            continue
+        word_res = tuple(re.compile(rf"\b{re.escape(w)}\b", flags=re.IGNORECASE) for w in words)
+        entries.append((st, dt, _icase_pat(st), word_res))
+    if len(_GLOSSARY_EN_ZH_CACHE) >= _GLOSSARY_EN_ZH_CACHE_MAX:
+        _GLOSSARY_EN_ZH_CACHE.clear()
+    automaton = _build_dst_term_automaton(entries)
+    _GLOSSARY_EN_ZH_CACHE[id(glossary)] = (glossary, entries, len(glossary), automaton)
+    return entries, automaton
+
+
 def quality_issues(
     tu: TranslationUnit,
     translated: str,
@@ -89,36 +228,50 @@ def quality_issues(
     source_lang: str,
     target_lang: str,
     glossary_dict: dict[str, str] | None = None,
+    plain_out: str | None = None,
 ) -> list[str]:
     if not translated:
         return ["empty_output"]
 
     issues: list[str] = []
 
-    tgt_unfrozen = unfreeze_text(translated, tu.nt_map)
-    plain_out = ANY_SENTINEL_RE.sub(" ", tgt_unfrozen)
-    plain_src = ANY_SENTINEL_RE.sub(" ", tu.source_surface)
-
-    if _ZERO_WIDTH_RE.search(plain_out):
+    # Callers that already stripped sentinels (review._eval) pass the plain output in.
+    if plain_out is None:
+        plain_out = _strip_sentinels(unfreeze_text(translated, tu.nt_map))
+    src_view = _source_view(tu)
+    plain_src = src_view.plain
+    # Whitespace-collapsed views, shared by every check below (same as _text_for_lang()).
+    plain_out_ws = _WS_RE.sub(" ", plain_out).strip()
+    plain_src_ws = src_view.plain_ws
+    out_low = plain_out_ws.lower()
+    src_low = src_view.low
+    out_len = len(plain_out_ws)
+    src_len = len(plain_src_ws)
+
+    # Cheap pre-screens: zero-width chars are non-ASCII, prompt tags need "[" and prompt keys need ":".
+    if not plain_out.isascii() and _ZERO_WIDTH_RE.search(plain_out):
         issues.append("zero_width_chars")
 
     if _REPEAT_CHAR_RE.search(plain_out):
         issues.append("repeated_char_run")
 
-    if (_PROMPT_TAG_RE.search(plain_out) or _PROMPT_KV_RE.search(plain_out)) and (
-        _PROMPT_TAG_RE.search(plain_src) is None and _PROMPT_KV_RE.search(plain_src) is None
-    ):
+    if (
+        ("[" in plain_out and _PROMPT_TAG_RE.search(plain_out)) or (":" in plain_out and _PROMPT_KV_RE.search(plain_out))
+    ) and (_PROMPT_TAG_RE.search(plain_src) is None and _PROMPT_KV_RE.search(plain_src) is None):
         issues.append("prompt_artifact")
 
     tgt = (target_lang or "").lower()
     src = (source_lang or "").lower()
 
-    if tgt.startswith("zh"):
-        allowed_scripts = set(_UNEXPECTED_SCRIPT_CHAR_RE.findall(plain_src))
-        found_scripts = set(_UNEXPECTED_SCRIPT_CHAR_RE.findall(plain_out))
-        if found_scripts - allowed_scripts:
+    if tgt.startswith("zh") or tgt.startswith("en"):
+        src_latin, src_cjk = src_view.latin, src_view.cjk
+        out_latin, _out_latin_ext, out_cjk = _script_counts(plain_out)
+        found_scripts = _unexpected_script_chars(plain_out)
+        if found_scripts and (found_scripts - src_view.unexpected_scripts):
             issues.append("unexpected_script")
 
+    if tgt.startswith("zh"):
+
         if "默认" in plain_out and re.search(r"\bDefault\b", plain_src, flags=re.IGNORECASE):
             if re.search(
                 r"\bby\s+default\b|\bdefault\s+settings?\b|\bdefault\s+value\b|\bdefault\s+configuration\b",
@@ -131,17 +284,11 @@ def quality_issues(
             issues.append("bad_reference_placeholder")
 
         # Variable/party marker preservation (X/Y/Z) after unfreezing.
-        for ch in ("X", "Y", "Z"):
-            if re.search(rf"\b{ch}\b", plain_src) and re.search(rf"\b{ch}\b", plain_out) is None:
+        for marker_re in _VAR_MARKER_RES:
+            if marker_re.search(plain_src) and marker_re.search(plain_out) is None:
                 issues.append("variable_marker_missing")
                 break
 
-        src_latin = len(_LATIN_RE.findall(plain_src))
-        src_cjk = len(_CJK_RE.findall(plain_src))
-        out_latin = len(_LATIN_RE.findall(plain_out))
-        out_cjk = len(_CJK_RE.findall(plain_out))
-        out_latin_ext = len(_LATIN_EXT_RE.findall(plain_out))
-
         if src.startswith("en") and src_latin >= 12:
             if out_cjk <= max(2, int(src_latin * 0.08)) and out_latin >= max(8, int(src_latin * 0.35)):
                 issues.append("looks_untranslated")
@@ -152,9 +299,6 @@ def quality_issues(
                     if out_cjk <= max(14, int(src_latin * 0.18)):
                         issues.append("coverage_low")
 
-        out_low = re.sub(r"\s+", " ", plain_out).strip().lower()
-        src_low = re.sub(r"\s+", " ", plain_src).strip().lower()
-
         # Detect untranslated English skeletons / mixed language.
         english_like = sum(1 for w in re.findall(r"[A-Za-z]{2,}", plain_out) if w.lower() in {"the", "and", "of", "to"})
         if out_latin >= 18 and out_cjk >= 6:
@@ -163,7 +307,7 @@ def quality_issues(
             issues.append("untranslated_english")
 
         for phrase in _LATIN_PHRASE_RE.findall(plain_out):
-            ph = re.sub(r"\s+", " ", phrase).strip()
+            ph = _WS_RE.sub(" ", phrase).strip()
             if len(ph) < 30:
                 continue
             if _looks_like_entity_name(ph):
@@ -172,20 +316,10 @@ def quality_issues(
             break
 
         # Detect source echo (copy-paste) excluding entity names.
-        for phrase in _LATIN_PHRASE_SHORT_RE.findall(plain_out):
-            ph = re.sub(r"\s+", " ", phrase).strip().lower()
-            if len(ph) < 12:
-                continue
-            if ph not in src_low or ph not in out_low:
-                continue
-            if _looks_like_entity_name(phrase):
-                continue
+        if out_latin and src_view.low_has_latin and _has_source_echo(plain_out, src_low, out_low):
             issues.append("source_echo")
-            break
 
         # Over expansion: too long compared to source.
-        src_len = len(re.sub(r"\s+", " ", plain_src).strip())
-        out_len = len(re.sub(r"\s+", " ", plain_out).strip())
         if src_len >= 40 and out_len >= int(src_len * 2.8):
             issues.append("over_expansion")
 
@@ -193,25 +327,10 @@ def quality_issues(
         if _ZH_COND_INJECT_RE.search(plain_out) and _EN_COND_RE.search(plain_src) is None:
             issues.append("unjustified_condition")
 
-        if src_len >= 80:
-            sent = re.split(r"[。！？；：.!?;:]", plain_out)
-            sent_norm = [re.sub(r"\s+", " ", s).strip() for s in sent if s and s.strip()]
-            freq: dict[str, int] = {}
-            for s in sent_norm:
-                if len(s) < 12:
-                    continue
-                freq[s] = freq.get(s, 0) + 1
-            if any(v >= 2 for v in freq.values()):
-                issues.append("repeated_sentence")
+        if src_len >= 80 and _has_repeated_sentence(plain_out):
+            issues.append("repeated_sentence")
 
     elif tgt.startswith("en"):
-        allowed_scripts = set(_UNEXPECTED_SCRIPT_CHAR_RE.findall(plain_src))
-        found_scripts = set(_UNEXPECTED_SCRIPT_CHAR_RE.findall(plain_out))
-        if found_scripts - allowed_scripts:
-            issues.append("unexpected_script")
-
-        src_plain = ANY_SENTINEL_RE.sub(" ", tu.source_surface)
-        src_cjk = len(_CJK_RE.findall(src_plain))
         out_words = len(re.findall(r"[A-Za-z]{2,}", plain_out))
 
         if src.startswith("zh") and src_cjk > 0:
@@ -223,55 +342,28 @@ def quality_issues(
                 if src_cjk >= 120 and out_words <= max(16, int(src_cjk * 0.18)):
                     issues.append("coverage_low")
 
-        src_low = re.sub(r"\s+", " ", plain_src).strip().lower()
-        out_low = re.sub(r"\s+", " ", plain_out).strip().lower()
-
-        for phrase in _LATIN_PHRASE_SHORT_RE.findall(plain_out):
-            ph = re.sub(r"\s+", " ", phrase).strip().lower()
-            if len(ph) < 12:
-                continue
-            if ph not in src_low or ph not in out_low:
-                continue
-            if _looks_like_entity_name(phrase):
-                continue
+        if out_latin and src_view.low_has_latin and _has_source_echo(plain_out, src_low, out_low):
             issues.append("source_echo")
-            break
 
-        src_len = len(re.sub(r"\s+", " ", plain_src).strip())
-        if src_len >= 80:
-            sent = re.split(r"[。！？；：.!?;:]", plain_out)
-            sent_norm = [re.sub(r"\s+", " ", s).strip() for s in sent if s and s.strip()]
-            freq: dict[str, int] = {}
-            for s in sent_norm:
-                if len(s) < 12:
-                    continue
-                freq[s] = freq.get(s, 0) + 1
-            if any(v >= 2 for v in freq.values()):
-                issues.append("repeated_sentence")
+        if src_len >= 80 and _has_repeated_sentence(plain_out):
+            issues.append("repeated_sentence")
 
     if glossary_dict:
-        src_plain = _text_for_lang(tu.source_surface)
-        out_plain = _text_for_lang(tgt_unfrozen)
-        src_low = src_plain.lower()
+        src_plain = plain_src_ws
+        out_plain = plain_out_ws
 
         if src.startswith("en") and tgt.startswith("zh"):
-            for src_term, dst_term in glossary_dict.items():
-                st = str(src_term).strip()
-                dt = str(dst_term).strip()
-                if not st or not dt:
-                    continue
-                if not _LATIN_RE.search(st) or not _CJK_RE.search(dt):
-                    continue
-                words = [w.lower() for w in re.findall(r"[A-Za-z]{4,}", st)]
-                if len(words) < 2:
-                    continue
-                if len(dt) < 6:
-                    continue
-                if dt not in out_plain:
-                    continue
-                if re.search(re.escape(st), src_plain, flags=re.IGNORECASE) is not None:
+            entries, automaton = _en_zh_glossary_entries(glossary_dict)
+            if automaton is not None:
+                # One pass over the output finds every target term present, overlaps included.
+                hit_idxs = sorted({i for _end, idxs in automaton.iter(out_plain) for i in idxs})
+                candidates = [entries[i] for i in hit_idxs]
+            else:
+                candidates = [e for e in entries if e[1] in out_plain]
+            for st, dt, st_re, word_res in candidates:
+                if st_re.search(src_plain) is not None:
                     continue
-                if any(re.search(rf"\b{re.escape(w)}\b", src_low, flags=re.IGNORECASE) for w in words):
+                if any(w_re.search(src_low) for w_re in word_res):
                     continue
                 issues.append(f"glossary_leakage:{st[:32]}")
                 break
@@ -293,5 +385,6 @@ def quality_issues(
                 issues.append(f"glossary_leakage:{dt[:32]}")
                 break
 
-    return sorted(set(issues))
+    # Callers merge protocol issues and sort once; only de-duplicate here.
+    return list(dict.fromkeys(issues))
 
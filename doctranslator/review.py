@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Callable
 
+from doctranslator.freezer import unfreeze_text
 from doctranslator.hierarchy import ParagraphContext
 from doctranslator.ir import TranslationUnit
 from doctranslator.models import ChatModel
 from doctranslator.protocol import normalize_candidate_translation, _validate_sentinels
-from doctranslator.quality import hard_issues, quality_issues
-from doctranslator.sentinels import ANY_SENTINEL_RE, decode_sentinels_from_model
+from doctranslator.quality import hard_issues, _plain_source, quality_issues
+from doctranslator.sentinels import _strip_sentinels, decode_sentinels_from_model
 from doctranslator.textutil import (
     _lang_prompt_name,
     _lang_prompt_native,
+    _local_glossary_lines,
     _preview_for_log,
     _scope_type,
     _should_translate_tu,
@@ -29,6 +34,8 @@ _DECISION_RISK_RE = re.compile(
     r")\b",
     flags=re.IGNORECASE,
 )
+# Characters that can match a letter of _DECISION_RISK_RE; IGNORECASE also folds these four non-ASCII ones.
+_RISK_LETTER_RE = re.compile(r"[A-Za-z\u0130\u0131\u017f\u212a]")
 
 
 @dataclass(frozen=True)
@@ -46,13 +53,10 @@ def _needs_review(
     para_ctx: ParagraphContext | None,
     decision_min_chars: int,
 ) -> bool:
-    if hard_issues(issues):
+    if issues and hard_issues(issues):
         return True
     if tu.force_ape:
         return True
-    src_plain = ANY_SENTINEL_RE.sub(" ", tu.source_surface)
-    if len(src_plain) >= max(0, int(decision_min_chars)):
-        return True
     if para_ctx is not None:
         if para_ctx.is_heading:
             return True
@@ -60,6 +64,13 @@ def _needs_review(
             return True
         if para_ctx.in_table:
             return True
+    # Cheapest-first: the risk-keyword regex is the only scan left, so it runs last.
+    src_plain = _plain_source(tu)
+    if len(src_plain) >= max(0, int(decision_min_chars)):
+        return True
+    # Short CJK-only sources (the common zh->en case) cannot contain a risk keyword.
+    if _RISK_LETTER_RE.search(src_plain) is None:
+        return False
     if _DECISION_RISK_RE.search(src_plain):
         return True
     return False
@@ -75,15 +86,49 @@ def _eval(
 ) -> tuple[list[str], str | None]:
     protocol_error: str | None = None
     issues: list[str] = []
+    plain_out = _strip_sentinels(unfreeze_text(text, tu.nt_map))
+    plain_src = _plain_source(tu)
     try:
-        _validate_sentinels(tu, text)
+        _validate_sentinels(tu, text, plain_src=plain_src, plain_out=plain_out)
     except Exception as exc:  # noqa: BLE001
         protocol_error = f"{type(exc).__name__}: {exc}"
         issues.append("protocol_error")
-    issues.extend(quality_issues(tu, text, source_lang=source_lang, target_lang=target_lang, glossary_dict=glossary_dict))
+    issues.extend(
+        quality_issues(
+            tu,
+            text,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            glossary_dict=glossary_dict,
+            plain_out=plain_out,
+        )
+    )
     return (sorted(set(issues)), protocol_error)
 
 
+# (tu_id, text) -> _eval() result. Keying on the text itself means a new final_translation simply misses.
+_EvalCache = dict[tuple[int, str], tuple[list[str], str | None]]
+
+
+def _cached_eval(
+    cache: _EvalCache | None,
+    tu: TranslationUnit,
+    text: str,
+    *,
+    source_lang: str,
+    target_lang: str,
+    glossary_dict: dict[str, str] | None,
+) -> tuple[list[str], str | None]:
+    if cache is None:
+        return _eval(tu, text, source_lang=source_lang, target_lang=target_lang, glossary_dict=glossary_dict)
+    key = (tu.tu_id, text)
+    hit = cache.get(key)
+    if hit is None:
+        hit = _eval(tu, text, source_lang=source_lang, target_lang=target_lang, glossary_dict=glossary_dict)
+        cache[key] = hit
+    return hit
+
+
 def _review_prompt(
     *,
     src_name: str,
@@ -149,24 +194,11 @@ def _review_prompt(
     )
 
 
-def _local_glossary_lines(glossary: dict[str, str] | None, *, text: str, max_items: int) -> str | None:
-    if not glossary or not text or max_items <= 0:
-        return None
-    src_plain = ANY_SENTINEL_RE.sub(" ", text)
-    matched: list[tuple[str, str]] = []
-    items = sorted(glossary.items(), key=lambda kv: len(str(kv[0])), reverse=True)
-    for k, v in items:
-        ks = str(k).strip()
-        vs = str(v).strip()
-        if not ks or not vs:
-            continue
-        if ks and (re.search(re.escape(ks), src_plain, flags=re.IGNORECASE) is not None):
-            matched.append((ks, vs))
-            if len(matched) >= max_items:
-                break
-    if not matched:
-        return None
-    return "\n".join([f"- {k} -> {v}" for k, v in matched])
+def _scan_workers(n_items: int) -> int:
+    # re holds the GIL, so threads only pay off on free-threaded interpreters.
+    if getattr(sys, "_is_gil_enabled", lambda: True)():
+        return 1
+    return max(1, min(8, os.cpu_count() or 1, n_items // 64))
 
 
 def scan_hard_failures(
@@ -175,18 +207,29 @@ def scan_hard_failures(
     source_lang: str,
     target_lang: str,
     ctx: AgentContext,
+    eval_cache: _EvalCache | None = None,
 ) -> list[HardFailure]:
-    failures: list[HardFailure] = []
     glossary_dict = ctx.glossary
-    for tu in tus:
+
+    def scan_one(tu: TranslationUnit) -> HardFailure | None:
         should_translate, skip_reason = _should_translate_tu(tu, source_lang=source_lang)
         if not should_translate:
-            continue
+            return None
         final = tu.final_translation or tu.draft_translation or tu.frozen_surface
-        issues, proto = _eval(tu, final, source_lang=source_lang, target_lang=target_lang, glossary_dict=glossary_dict)
+        issues, proto = _cached_eval(
+            eval_cache, tu, final, source_lang=source_lang, target_lang=target_lang, glossary_dict=glossary_dict
+        )
         if hard_issues(issues):
-            failures.append(HardFailure(tu=tu, skip_reason=skip_reason, issues=issues, protocol_error=proto))
-    return failures
+            return HardFailure(tu=tu, skip_reason=skip_reason, issues=issues, protocol_error=proto)
+        return None
+
+    workers = _scan_workers(len(tus))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(scan_one, tus))
+    else:
+        results = [scan_one(tu) for tu in tus]
+    return [r for r in results if r is not None]
 
 
 def final_review_and_repair(
@@ -219,6 +262,7 @@ def final_review_and_repair(
     src_name = _lang_prompt_name(source_lang)
     tgt_name = _lang_prompt_name(target_lang)
     tgt_native = _lang_prompt_native(target_lang)
+    eval_cache: _EvalCache = {}
 
     for i, tu in enumerate(tus, start=1):
         should_translate, skip_reason = _should_translate_tu(tu, source_lang=source_lang)
@@ -234,7 +278,9 @@ def final_review_and_repair(
         neighbor_next = tus[i].source_surface if i < len(tus) else None
         glossary_lines = _local_glossary_lines(glossary_dict, text=tu.source_surface, max_items=glossary_max_items_per_tu)
 
-        issues, proto = _eval(tu, draft, source_lang=source_lang, target_lang=target_lang, glossary_dict=glossary_dict)
+        issues, proto = _cached_eval(
+            eval_cache, tu, draft, source_lang=source_lang, target_lang=target_lang, glossary_dict=glossary_dict
+        )
         if not _needs_review(tu, issues=issues, para_ctx=para_ctx, decision_min_chars=decision_min_chars):
             tu.final_translation = draft
             progress.progress("Final review", i, max(total, 1))
@@ -286,7 +332,9 @@ def final_review_and_repair(
         cand, ws_flags = normalize_candidate_translation(tu, cand, source_lang=source_lang, target_lang=target_lang)
         if ws_flags:
             tu.ws_flags = sorted(set([*tu.ws_flags, *ws_flags]))
-        new_issues, _new_proto = _eval(tu, cand, source_lang=source_lang, target_lang=target_lang, glossary_dict=glossary_dict)
+        new_issues, _new_proto = _cached_eval(
+            eval_cache, tu, cand, source_lang=source_lang, target_lang=target_lang, glossary_dict=glossary_dict
+        )
 
         # Accept rewrite only if it does not introduce hard issues, and improves (or fixes) problems.
         if hard_issues(new_issues):
@@ -299,7 +347,9 @@ def final_review_and_repair(
                 on_tu_revised(tu)
         progress.progress("Final review", i, max(total, 1))
 
-    failures = scan_hard_failures(tus=tus, source_lang=source_lang, target_lang=target_lang, ctx=ctx)
+    failures = scan_hard_failures(
+        tus=tus, source_lang=source_lang, target_lang=target_lang, ctx=ctx, eval_cache=eval_cache
+    )
     if not failures:
         return
 
@@ -307,7 +357,9 @@ def final_review_and_repair(
 
     max_rounds = max(0, int(repair_rounds))
     for round_idx in range(max_rounds):
-        failures = scan_hard_failures(tus=tus, source_lang=source_lang, target_lang=target_lang, ctx=ctx)
+        failures = scan_hard_failures(
+            tus=tus, source_lang=source_lang, target_lang=target_lang, ctx=ctx, eval_cache=eval_cache
+        )
         if not failures:
             return
         progress.info(f"Hard-failure repair round {round_idx + 1}/{max_rounds}: items={len(failures)}")
@@ -348,7 +400,9 @@ def final_review_and_repair(
             cand, ws_flags = normalize_candidate_translation(tu, cand, source_lang=source_lang, target_lang=target_lang)
             if ws_flags:
                 tu.ws_flags = sorted(set([*tu.ws_flags, *ws_flags]))
-            new_issues, _new_proto = _eval(tu, cand, source_lang=source_lang, target_lang=target_lang, glossary_dict=glossary_dict)
+            new_issues, _new_proto = _cached_eval(
+                eval_cache, tu, cand, source_lang=source_lang, target_lang=target_lang, glossary_dict=glossary_dict
+            )
             if hard_issues(new_issues):
                 progress.info(
                     f"Hard-failure repair TU#{tu.tu_id} still has issues: "
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 # NOTE: This module is used by the verification scripts in `scripts/`.
 # It must be stable ASCII/UTF-8 and match the Rust sentinels in `src/sentinels.rs`.
@@ -15,6 +16,7 @@ NBH = "<<MT_NBH>>"
 SHY = "<<MT_SHY>>"
 
 CONTROL_TOKENS = (TAB, BR, NBH, SHY)
+CONTROL_TOKEN_RE = re.compile("|".join(re.escape(tok) for tok in CONTROL_TOKENS))
 
 
 def nt_token(nt_id: int) -> str:
@@ -34,33 +36,35 @@ ANY_SENTINEL_RE = re.compile(
 )
 NT_RE = re.compile(r"<<MT_NT:(\d{4})>>")
 
+
+def _strip_sentinels(text: str) -> str:
+    # Most texts carry no sentinel at all; skip the regex pass for them.
+    if "<<MT_" not in text:
+        return text
+    return ANY_SENTINEL_RE.sub(" ", text)
+
+
 _ALT_BRACKET_SENTINEL_RE = re.compile(
-    r"(?:\[\[|\u3010|\u300a)\s*([A-Za-z]{2,4}(?::\d{1,6})?)\s*(?:\]\]|\u3011|\u300b)"
+    r"(?:\[\[|\u3010|\u300a)\s*"
+    r"(?:(?P<ctl>TAB|BR|NBH|SHY)|NT:(?P<nt>\d{1,4})|(?P<seg>SEG|END):(?P<sid>\d{1,6}))"
+    r"\s*(?:\]\]|\u3011|\u300b)"
 )
 
 
-def _normalize_sentinel_content(raw: str) -> str | None:
-    raw = raw.strip()
-    if raw in {"TAB", "BR", "NBH", "SHY"}:
-        return raw
-    m = re.fullmatch(r"NT:(\d{1,4})", raw)
-    if m:
-        return f"NT:{int(m.group(1)):0{NT_ID_WIDTH}d}"
-    m = re.fullmatch(r"(SEG|END):(\d{1,6})", raw)
-    if m:
-        return f"{m.group(1)}:{int(m.group(2)):0{SEG_ID_WIDTH}d}"
-    return None
+def _repl_alt_sentinel(m: re.Match[str]) -> str:
+    ctl = m.group("ctl")
+    if ctl is not None:
+        return f"<<MT_{ctl}>>"
+    nt = m.group("nt")
+    if nt is not None:
+        return f"<<MT_NT:{int(nt):0{NT_ID_WIDTH}d}>>"
+    return f"<<MT_{m.group('seg')}:{int(m.group('sid')):0{SEG_ID_WIDTH}d}>>"
 
 
 def decode_sentinels_from_model(text: str) -> str:
     if not text:
         return ""
-
-    def repl_alt(m: re.Match[str]) -> str:
-        norm = _normalize_sentinel_content(m.group(1))
-        return f"<<MT_{norm}>>" if norm is not None else m.group(0)
-
-    return _ALT_BRACKET_SENTINEL_RE.sub(repl_alt, text)
+    return _ALT_BRACKET_SENTINEL_RE.sub(_repl_alt_sentinel, text)
 
 
 @dataclass(frozen=True)
@@ -68,6 +72,11 @@ class ParsedSegments:
     by_id: dict[int, str]
 
 
+@lru_cache(maxsize=4096)
+def _tolerant_marker_re(marker_type: str, seg_id: int) -> re.Pattern[str]:
+    return re.compile(rf"<<MT_{marker_type}:\s*0*{seg_id}\s*>>")
+
+
 def _find_marker(text: str, marker_type: str, seg_id: int, cursor: int) -> tuple[int, int]:
     exact = f"<<MT_{marker_type}:{seg_id:0{SEG_ID_WIDTH}d}>>"
     idx = text.find(exact, cursor)
@@ -75,8 +84,7 @@ def _find_marker(text: str, marker_type: str, seg_id: int, cursor: int) -> tuple
         return (idx, idx + len(exact))
 
     # Tolerant fallback: allow whitespace around id.
-    pat = re.compile(rf"<<MT_{marker_type}:\s*0*{seg_id}\s*>>")
-    m = pat.search(text, cursor)
+    m = _tolerant_marker_re(marker_type, seg_id).search(text, cursor)
     if not m:
         return (-1, -1)
     return (m.start(), m.end())
@@ -100,8 +108,7 @@ def parse_segmented_output(text: str, expected_ids: list[int]) -> ParsedSegments
 
 
 def control_tokens_from_text(text: str) -> list[str]:
-    if not text:
+    if not text or "<<MT_" not in text:
         return []
-    pattern = re.compile("|".join(re.escape(tok) for tok in CONTROL_TOKENS))
-    return [m.group(0) for m in pattern.finditer(text)]
+    return CONTROL_TOKEN_RE.findall(text)
 
@@ -3,14 +3,47 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable, Mapping
 
 
-def _find_project_root(start: Path) -> Path | None:
+def _dir_has_gguf(path: Path) -> bool:
+    # Same match as Path.glob("*.gguf"), but stops at the first hit and builds no Path objects.
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if os.path.normcase(entry.name).endswith(".gguf"):
+                    return True
+    except OSError:
+        return False
+    return False
+
+
+def _gguf_names(path: Path) -> set[str]:
+    # Names that Path.exists() would accept (dangling symlinks excluded).
+    names: set[str] = set()
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                name = os.path.normcase(entry.name)
+                if name.endswith(".gguf") and (not entry.is_symlink() or os.path.exists(entry.path)):
+                    names.add(name)
+    except OSError:
+        pass
+    return names
+
+
+def _find_project_root(start: Path, seen: dict[Path, bool] | None = None) -> Path | None:
     start = start.resolve()
     if start.is_file():
         start = start.parent
     for parent in (start, *start.parents):
-        if any(parent.glob("*.gguf")):
+        if seen is None:
+            hit = _dir_has_gguf(parent)
+        else:
+            hit = seen.get(parent)
+            if hit is None:
+                hit = seen[parent] = _dir_has_gguf(parent)
+        if hit:
             return parent
     return None
 
@@ -20,25 +53,27 @@ def _auto_workdir() -> Path:
         Path.cwd(),
         Path(__file__).resolve().parent,
     ]
+    # The candidates usually share most of their ancestors; scan each directory once.
+    seen: dict[Path, bool] = {}
     for start in candidates:
-        root = _find_project_root(start)
+        root = _find_project_root(start, seen)
         if root is not None:
             return root
     return Path.cwd()
 
 
-def _resolve_path(env_value: str, workdir: Path) -> Path:
+def _resolve_path(env_value: str, workdir: Path, exists: Callable[[Path], bool] = Path.exists) -> Path:
     raw = Path(env_value)
-    if raw.is_absolute() or raw.exists():
+    if raw.is_absolute() or exists(raw):
         return raw
     alt = workdir / raw
-    if alt.exists():
+    if exists(alt):
         return alt
     return raw
 
 
-def _int_env(name: str, default: int) -> int:
-    raw = os.getenv(name)
+def _int_env(name: str, default: int, env: Mapping[str, str] = os.environ) -> int:
+    raw = env.get(name)
     if raw is None:
         return default
     try:
@@ -47,15 +82,8 @@ def _int_env(name: str, default: int) -> int:
         return default
 
 
-def _bool_env(name: str, default: bool) -> bool:
-    raw = os.getenv(name)
-    if raw is None:
-        return default
-    return str(raw).strip().lower() not in {"0", "false", "no", "off"}
-
-
-def _float_env(name: str, default: float) -> float:
-    raw = os.getenv(name)
+def _float_env(name: str, default: float, env: Mapping[str, str] = os.environ) -> float:
+    raw = env.get(name)
     if raw is None:
         return default
     try:
@@ -64,7 +92,66 @@ def _float_env(name: str, default: float) -> float:
         return default
 
 
-@dataclass(frozen=True)
+# Plain env knobs: (field, env var, default). Int knobs also carry a floor; values below it are clamped.
+_BOOL_ENV_SPEC: tuple[tuple[str, str, bool], ...] = (
+    ("enable_style_guide", "DOC_TRANSLATOR_ENABLE_STYLE_GUIDE", True),
+    ("enable_decision", "DOC_TRANSLATOR_ENABLE_DECISION", True),
+    # Default: single translator (TranslateGemma) + one agent model (Gemma-3-12B).
+    ("enable_second_translator", "DOC_TRANSLATOR_ENABLE_SECOND_TRANSLATOR", False),
+    # Embeddings are optional and expensive to init on 12B; default off.
+    ("enable_embeddings", "DOC_TRANSLATOR_ENABLE_EMBEDDINGS", False),
+    ("embedding_use_for_rerank", "DOC_TRANSLATOR_EMBEDDING_RERANK", False),
+    ("embedding_use_for_context", "DOC_TRANSLATOR_EMBEDDING_CONTEXT", False),
+    ("llama_verbose", "DOC_TRANSLATOR_LLAMA_VERBOSE", False),
+    # Default off: we use Gemma-3-12B agent review/merge instead of a separate APE pass.
+    ("enable_ape", "DOC_TRANSLATOR_ENABLE_APE", False),
+    ("progress", "DOC_TRANSLATOR_PROGRESS", True),
+    ("log_tu_samples", "DOC_TRANSLATOR_LOG_TU_SAMPLES", True),
+    ("enable_context", "DOC_TRANSLATOR_ENABLE_CONTEXT", True),
+)
+
+_INT_ENV_SPEC: tuple[tuple[str, str, int, int | None], ...] = (
+    ("decision_min_chars", "DOC_TRANSLATOR_DECISION_MIN_CHARS", 220, 0),
+    ("embedding_top_k", "DOC_TRANSLATOR_EMBEDDING_TOP_K", 4, 0),
+    ("embedding_max_chars", "DOC_TRANSLATOR_EMBEDDING_MAX_CHARS", 360, 0),
+    ("llama_n_gpu_layers", "DOC_TRANSLATOR_LLAMA_N_GPU_LAYERS", -1, None),
+    ("llama_seed", "DOC_TRANSLATOR_LLAMA_SEED", 0, None),
+    ("llama_n_gpu_layers_embed", "DOC_TRANSLATOR_LLAMA_N_GPU_LAYERS_EMBED", 0, None),
+    # In-RAM KV prompt cache per model (MiB); 0 keeps llama.cpp's single-slot prefix reuse only.
+    ("llama_prompt_cache_mb", "DOC_TRANSLATOR_LLAMA_PROMPT_CACHE_MB", 0, 0),
+    ("max_input_tokens", "DOC_TRANSLATOR_MAX_INPUT_TOKENS", 1800, None),
+    ("max_new_tokens", "DOC_TRANSLATOR_MAX_NEW_TOKENS", 1024, None),
+    ("log_tu_max_chars", "DOC_TRANSLATOR_LOG_TU_MAX_CHARS", 120, None),
+    ("log_tu_every", "DOC_TRANSLATOR_LOG_TU_EVERY", 20, 1),
+    ("context_max_excerpts", "DOC_TRANSLATOR_CONTEXT_MAX_EXCERPTS", 40, 0),
+    ("glossary_max_terms", "DOC_TRANSLATOR_GLOSSARY_MAX_TERMS", 40, 0),
+    ("glossary_max_items_per_tu", "DOC_TRANSLATOR_GLOSSARY_MAX_ITEMS_PER_TU", 16, 0),
+    ("checkpoint_every", "DOC_TRANSLATOR_CHECKPOINT_EVERY", 50, 0),
+    ("hard_failure_repair_rounds", "DOC_TRANSLATOR_HARD_FAILURE_REPAIR_ROUNDS", 6, 0),
+    ("max_tus", "DOC_TRANSLATOR_MAX_TUS", 0, 0),
+)
+
+
+def _spec_env_values(env: Mapping[str, str]) -> dict[str, Any]:
+    values: dict[str, Any] = {}
+    for field, name, default in _BOOL_ENV_SPEC:
+        raw = env.get(name)
+        values[field] = default if raw is None else raw.strip().lower() not in {"0", "false", "no", "off"}
+    for field, name, default, floor in _INT_ENV_SPEC:
+        raw = env.get(name)
+        value = default
+        if raw is not None:
+            try:
+                value = int(raw.strip())
+            except ValueError:
+                pass
+        if floor is not None and value < floor:
+            value = floor
+        values[field] = value
+    return values
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
 class Settings:
     workdir: Path
     translategemma_gguf: Path
@@ -95,6 +182,7 @@ class Settings:
     llama_n_gpu_layers: int
     llama_n_gpu_layers_embed: int
     llama_seed: int
+    llama_prompt_cache_mb: int
     llama_verbose: bool
     llama_chat_format: str | None
     llama_chat_format_translate: str | None
@@ -118,15 +206,40 @@ class Settings:
 
     @staticmethod
     def from_env() -> "Settings":
-        workdir_env = os.getenv("DOC_TRANSLATOR_WORKDIR")
+        # Snapshot the relevant environment once; every setting is read from the snapshot.
+        # Not cached: model paths and the auto workdir depend on files that may come and go.
+        env = {k: v for k, v in os.environ.items() if k.startswith("DOC_TRANSLATOR_")}
+        return Settings._from_env(env)
+
+    @staticmethod
+    def _from_env(env: Mapping[str, str]) -> "Settings":
+        workdir_env = env.get("DOC_TRANSLATOR_WORKDIR")
         workdir = Path(workdir_env) if workdir_env else _auto_workdir()
 
+        # Several candidate model paths are probed more than once; stat each only once.
+        # The default models all sit directly in the workdir, so one listing answers those.
+        exists_memo: dict[Path, bool] = {}
+        workdir_ggufs: set[str] | None = None
+
+        def exists(path: Path) -> bool:
+            nonlocal workdir_ggufs
+            hit = exists_memo.get(path)
+            if hit is None:
+                if path.parent == workdir and path.name.endswith(".gguf"):
+                    if workdir_ggufs is None:
+                        workdir_ggufs = _gguf_names(workdir)
+                    hit = os.path.normcase(path.name) in workdir_ggufs
+                else:
+                    hit = path.exists()
+                exists_memo[path] = hit
+            return hit
+
         # Primary translation model (GGUF).
         #
         # Compatibility:
         # - DOC_TRANSLATOR_TRANSLATEGEMMA_GGUF: legacy env name (kept)
         # - DOC_TRANSLATOR_TRANSLATE_GGUF: preferred env name (new)
-        translate_gguf_env = os.getenv("DOC_TRANSLATOR_TRANSLATE_GGUF") or os.getenv(
+        translate_gguf_env = env.get("DOC_TRANSLATOR_TRANSLATE_GGUF") or env.get(
             "DOC_TRANSLATOR_TRANSLATEGEMMA_GGUF"
         )
 
@@ -134,111 +247,90 @@ class Settings:
         hy_mt_q4 = workdir / "HY-MT1.5-1.8B-Q4_K_M.gguf"
 
         if translate_gguf_env:
-            translategemma_gguf = _resolve_path(translate_gguf_env, workdir)
+            translategemma_gguf = _resolve_path(translate_gguf_env, workdir, exists)
         else:
             # Default: prefer HY-MT if present in repo root; otherwise fall back to TranslateGemma.
-            if hy_mt_q8.exists():
+            if exists(hy_mt_q8):
                 translategemma_gguf = hy_mt_q8
-            elif hy_mt_q4.exists():
+            elif exists(hy_mt_q4):
                 translategemma_gguf = hy_mt_q4
             else:
                 translategemma_gguf = workdir / "translategemma-12b-it.i1-Q5_K_M.gguf"
 
-        hy_mt_gguf_env = os.getenv("DOC_TRANSLATOR_HY_MT_GGUF")
-        hy_mt_gguf = _resolve_path(hy_mt_gguf_env, workdir) if hy_mt_gguf_env else None
-        if hy_mt_gguf and not hy_mt_gguf.exists():
+        hy_mt_gguf_env = env.get("DOC_TRANSLATOR_HY_MT_GGUF")
+        hy_mt_gguf = _resolve_path(hy_mt_gguf_env, workdir, exists) if hy_mt_gguf_env else None
+        if hy_mt_gguf and not exists(hy_mt_gguf):
             hy_mt_gguf = None
         if hy_mt_gguf is None:
             # Auto-detect a secondary HY-MT model for optional dual-translator setups.
             for cand in (hy_mt_q8, hy_mt_q4):
-                if cand.exists() and cand != translategemma_gguf:
+                if exists(cand) and cand != translategemma_gguf:
                     hy_mt_gguf = cand
                     break
 
-        gemma3_12b_gguf_env = os.getenv("DOC_TRANSLATOR_GEMMA3_12B_GGUF")
+        gemma3_12b_gguf_env = env.get("DOC_TRANSLATOR_GEMMA3_12B_GGUF")
         gemma3_12b_gguf = (
-            _resolve_path(gemma3_12b_gguf_env, workdir)
+            _resolve_path(gemma3_12b_gguf_env, workdir, exists)
             if gemma3_12b_gguf_env
             else (workdir / "gemma-3-12b-it-q4_0.gguf")
         )
-        if gemma3_12b_gguf and not gemma3_12b_gguf.exists():
+        if gemma3_12b_gguf and not exists(gemma3_12b_gguf):
             gemma3_12b_gguf = None
 
         # Gemma3-1B is optional. Default: disabled unless explicitly configured via env.
-        gemma3_1b_gguf_env = os.getenv("DOC_TRANSLATOR_GEMMA3_1B_GGUF")
-        gemma3_1b_gguf = _resolve_path(gemma3_1b_gguf_env, workdir) if gemma3_1b_gguf_env else None
-        if gemma3_1b_gguf and not gemma3_1b_gguf.exists():
+        gemma3_1b_gguf_env = env.get("DOC_TRANSLATOR_GEMMA3_1B_GGUF")
+        gemma3_1b_gguf = _resolve_path(gemma3_1b_gguf_env, workdir, exists) if gemma3_1b_gguf_env else None
+        if gemma3_1b_gguf and not exists(gemma3_1b_gguf):
             gemma3_1b_gguf = None
 
-        embedding_gguf_env = os.getenv("DOC_TRANSLATOR_EMBEDDING_GGUF")
-        embedding_gguf = _resolve_path(embedding_gguf_env, workdir) if embedding_gguf_env else None
-        if embedding_gguf and not embedding_gguf.exists():
+        embedding_gguf_env = env.get("DOC_TRANSLATOR_EMBEDDING_GGUF")
+        embedding_gguf = _resolve_path(embedding_gguf_env, workdir, exists) if embedding_gguf_env else None
+        if embedding_gguf and not exists(embedding_gguf):
             embedding_gguf = None
 
-        source_lang_code = os.getenv("DOC_TRANSLATOR_SOURCE_LANG") or None
-        target_lang_code = os.getenv("DOC_TRANSLATOR_TARGET_LANG") or None
+        source_lang_code = env.get("DOC_TRANSLATOR_SOURCE_LANG") or None
+        target_lang_code = env.get("DOC_TRANSLATOR_TARGET_LANG") or None
 
-        target_style = os.getenv("DOC_TRANSLATOR_TARGET_STYLE")
+        target_style = env.get("DOC_TRANSLATOR_TARGET_STYLE")
         target_style = target_style.strip() if isinstance(target_style, str) and target_style.strip() else None
-        enable_style_guide = _bool_env("DOC_TRANSLATOR_ENABLE_STYLE_GUIDE", True)
-        enable_decision = _bool_env("DOC_TRANSLATOR_ENABLE_DECISION", True)
-        decision_min_chars = _int_env("DOC_TRANSLATOR_DECISION_MIN_CHARS", 220)
-        if decision_min_chars < 0:
-            decision_min_chars = 0
-
-        # Default: single translator (TranslateGemma) + one agent model (Gemma-3-12B).
-        enable_second_translator = _bool_env("DOC_TRANSLATOR_ENABLE_SECOND_TRANSLATOR", False)
-        second_translator_mode = (os.getenv("DOC_TRANSLATOR_SECOND_TRANSLATOR_MODE") or "off").strip().lower()
+        second_translator_mode = (env.get("DOC_TRANSLATOR_SECOND_TRANSLATOR_MODE") or "off").strip().lower()
         if second_translator_mode not in {"off", "auto", "always"}:
             second_translator_mode = "off"
 
-        # Embeddings are optional and expensive to init on 12B; default off.
-        enable_embeddings = _bool_env("DOC_TRANSLATOR_ENABLE_EMBEDDINGS", False)
-        embedding_use_for_rerank = _bool_env("DOC_TRANSLATOR_EMBEDDING_RERANK", False)
-        embedding_use_for_context = _bool_env("DOC_TRANSLATOR_EMBEDDING_CONTEXT", False)
-        embedding_top_k = _int_env("DOC_TRANSLATOR_EMBEDDING_TOP_K", 4)
-        if embedding_top_k < 0:
-            embedding_top_k = 0
-        embedding_max_chars = _int_env("DOC_TRANSLATOR_EMBEDDING_MAX_CHARS", 360)
-        if embedding_max_chars < 0:
-            embedding_max_chars = 0
-        embedding_min_sim = _float_env("DOC_TRANSLATOR_EMBEDDING_MIN_SIM", 0.0)
+        embedding_min_sim = _float_env("DOC_TRANSLATOR_EMBEDDING_MIN_SIM", 0.0, env)
         if embedding_min_sim < 0:
             embedding_min_sim = 0.0
 
-        llama_n_ctx = _int_env("DOC_TRANSLATOR_LLAMA_N_CTX", 2048)
+        llama_n_ctx = _int_env("DOC_TRANSLATOR_LLAMA_N_CTX", 2048, env)
         if llama_n_ctx < 256:
             llama_n_ctx = 2048
 
-        llama_n_threads = _int_env("DOC_TRANSLATOR_LLAMA_N_THREADS", os.cpu_count() or 8)
+        llama_n_threads = _int_env("DOC_TRANSLATOR_LLAMA_N_THREADS", os.cpu_count() or 8, env)
         if llama_n_threads < 1:
             llama_n_threads = 1
 
-        llama_n_gpu_layers = _int_env("DOC_TRANSLATOR_LLAMA_N_GPU_LAYERS", -1)
-        llama_seed = _int_env("DOC_TRANSLATOR_LLAMA_SEED", 0)
-        llama_verbose = _bool_env("DOC_TRANSLATOR_LLAMA_VERBOSE", False)
-        llama_chat_format_raw = os.getenv("DOC_TRANSLATOR_LLAMA_CHAT_FORMAT")
+        llama_chat_format_raw = env.get("DOC_TRANSLATOR_LLAMA_CHAT_FORMAT")
         llama_chat_format = (llama_chat_format_raw or "gemma").strip() or None
         if llama_chat_format and llama_chat_format.lower() in {"auto", "none"}:
             llama_chat_format = None
 
-        llama_n_ctx_translate = _int_env("DOC_TRANSLATOR_LLAMA_N_CTX_TRANSLATE", llama_n_ctx)
+        llama_n_ctx_translate = _int_env("DOC_TRANSLATOR_LLAMA_N_CTX_TRANSLATE", llama_n_ctx, env)
         if llama_n_ctx_translate < 256:
             llama_n_ctx_translate = llama_n_ctx
 
-        llama_n_ctx_gemma = _int_env("DOC_TRANSLATOR_LLAMA_N_CTX_GEMMA", llama_n_ctx)
+        llama_n_ctx_gemma = _int_env("DOC_TRANSLATOR_LLAMA_N_CTX_GEMMA", llama_n_ctx, env)
         if llama_n_ctx_gemma < 256:
             llama_n_ctx_gemma = llama_n_ctx
 
-        llama_n_ctx_hy_mt = _int_env("DOC_TRANSLATOR_LLAMA_N_CTX_HY_MT", llama_n_ctx_translate)
+        llama_n_ctx_hy_mt = _int_env("DOC_TRANSLATOR_LLAMA_N_CTX_HY_MT", llama_n_ctx_translate, env)
         if llama_n_ctx_hy_mt < 256:
             llama_n_ctx_hy_mt = llama_n_ctx_translate
 
-        llama_n_ctx_embed = _int_env("DOC_TRANSLATOR_LLAMA_N_CTX_EMBED", 2048)
+        llama_n_ctx_embed = _int_env("DOC_TRANSLATOR_LLAMA_N_CTX_EMBED", 2048, env)
         if llama_n_ctx_embed < 256:
             llama_n_ctx_embed = 2048
 
-        llama_chat_format_translate_raw = os.getenv("DOC_TRANSLATOR_LLAMA_CHAT_FORMAT_TRANSLATE")
+        llama_chat_format_translate_raw = env.get("DOC_TRANSLATOR_LLAMA_CHAT_FORMAT_TRANSLATE")
         if llama_chat_format_translate_raw is not None:
             llama_chat_format_translate = llama_chat_format_translate_raw.strip() or None
         else:
@@ -250,12 +342,12 @@ class Settings:
         if llama_chat_format_translate and llama_chat_format_translate.lower() in {"auto", "none"}:
             llama_chat_format_translate = None
 
-        llama_chat_format_gemma_raw = os.getenv("DOC_TRANSLATOR_LLAMA_CHAT_FORMAT_GEMMA")
+        llama_chat_format_gemma_raw = env.get("DOC_TRANSLATOR_LLAMA_CHAT_FORMAT_GEMMA")
         llama_chat_format_gemma = (llama_chat_format_gemma_raw or llama_chat_format_raw or "gemma").strip() or None
         if llama_chat_format_gemma and llama_chat_format_gemma.lower() in {"auto", "none"}:
             llama_chat_format_gemma = None
 
-        llama_chat_format_hy_mt_raw = os.getenv("DOC_TRANSLATOR_LLAMA_CHAT_FORMAT_HY_MT")
+        llama_chat_format_hy_mt_raw = env.get("DOC_TRANSLATOR_LLAMA_CHAT_FORMAT_HY_MT")
         if llama_chat_format_hy_mt_raw is not None:
             llama_chat_format_hy_mt = llama_chat_format_hy_mt_raw.strip() or None
         else:
@@ -264,53 +356,14 @@ class Settings:
         if llama_chat_format_hy_mt and llama_chat_format_hy_mt.lower() in {"auto", "none"}:
             llama_chat_format_hy_mt = None
 
-        llama_n_gpu_layers_embed = _int_env("DOC_TRANSLATOR_LLAMA_N_GPU_LAYERS_EMBED", 0)
-
-        max_input_tokens = _int_env("DOC_TRANSLATOR_MAX_INPUT_TOKENS", 1800)
-        max_new_tokens = _int_env("DOC_TRANSLATOR_MAX_NEW_TOKENS", 1024)
-
-        # Default off: we use Gemma-3-12B agent review/merge instead of a separate APE pass.
-        enable_ape = _bool_env("DOC_TRANSLATOR_ENABLE_APE", False)
-        progress = _bool_env("DOC_TRANSLATOR_PROGRESS", True)
-        log_tu_samples = _bool_env("DOC_TRANSLATOR_LOG_TU_SAMPLES", True)
-        log_tu_max_chars = _int_env("DOC_TRANSLATOR_LOG_TU_MAX_CHARS", 120)
-
         try:
-            heartbeat_seconds = float(os.getenv("DOC_TRANSLATOR_HEARTBEAT_SECONDS", "8"))
+            heartbeat_seconds = float(env.get("DOC_TRANSLATOR_HEARTBEAT_SECONDS", "8"))
         except Exception:  # noqa: BLE001
             heartbeat_seconds = 8.0
         if heartbeat_seconds < 0:
             heartbeat_seconds = 0.0
-        log_tu_every = _int_env("DOC_TRANSLATOR_LOG_TU_EVERY", 20)
-        if log_tu_every < 1:
-            log_tu_every = 1
-
-        enable_context = _bool_env("DOC_TRANSLATOR_ENABLE_CONTEXT", True)
-        context_max_excerpts = _int_env("DOC_TRANSLATOR_CONTEXT_MAX_EXCERPTS", 40)
-        if context_max_excerpts < 0:
-            context_max_excerpts = 0
-
-        glossary_max_terms = _int_env("DOC_TRANSLATOR_GLOSSARY_MAX_TERMS", 40)
-        if glossary_max_terms < 0:
-            glossary_max_terms = 0
-
-        glossary_max_items_per_tu = _int_env("DOC_TRANSLATOR_GLOSSARY_MAX_ITEMS_PER_TU", 16)
-        if glossary_max_items_per_tu < 0:
-            glossary_max_items_per_tu = 0
-
-        checkpoint_every = _int_env("DOC_TRANSLATOR_CHECKPOINT_EVERY", 50)
-        if checkpoint_every < 0:
-            checkpoint_every = 0
-
-        hard_failure_repair_rounds = _int_env("DOC_TRANSLATOR_HARD_FAILURE_REPAIR_ROUNDS", 6)
-        if hard_failure_repair_rounds < 0:
-            hard_failure_repair_rounds = 0
-
-        max_tus = _int_env("DOC_TRANSLATOR_MAX_TUS", 0)
-        if max_tus < 0:
-            max_tus = 0
-
         return Settings(
+            **_spec_env_values(env),
             workdir=workdir,
             translategemma_gguf=translategemma_gguf,
             hy_mt_gguf=hy_mt_gguf,
@@ -320,16 +373,7 @@ class Settings:
             source_lang_code=source_lang_code,
             target_lang_code=target_lang_code,
             target_style=target_style,
-            enable_style_guide=enable_style_guide,
-            enable_decision=enable_decision,
-            decision_min_chars=decision_min_chars,
-            enable_second_translator=enable_second_translator,
             second_translator_mode=second_translator_mode,
-            enable_embeddings=enable_embeddings,
-            embedding_use_for_rerank=embedding_use_for_rerank,
-            embedding_use_for_context=embedding_use_for_context,
-            embedding_top_k=embedding_top_k,
-            embedding_max_chars=embedding_max_chars,
             embedding_min_sim=embedding_min_sim,
             llama_n_ctx=llama_n_ctx,
             llama_n_ctx_translate=llama_n_ctx_translate,
@@ -337,27 +381,9 @@ class Settings:
             llama_n_ctx_hy_mt=llama_n_ctx_hy_mt,
             llama_n_ctx_embed=llama_n_ctx_embed,
             llama_n_threads=llama_n_threads,
-            llama_n_gpu_layers=llama_n_gpu_layers,
-            llama_n_gpu_layers_embed=llama_n_gpu_layers_embed,
-            llama_seed=llama_seed,
-            llama_verbose=llama_verbose,
             llama_chat_format=llama_chat_format,
             llama_chat_format_translate=llama_chat_format_translate,
             llama_chat_format_gemma=llama_chat_format_gemma,
             llama_chat_format_hy_mt=llama_chat_format_hy_mt,
-            max_input_tokens=max_input_tokens,
-            max_new_tokens=max_new_tokens,
-            enable_ape=enable_ape,
-            progress=progress,
-            log_tu_samples=log_tu_samples,
-            log_tu_max_chars=log_tu_max_chars,
             heartbeat_seconds=heartbeat_seconds,
-            log_tu_every=log_tu_every,
-            enable_context=enable_context,
-            context_max_excerpts=context_max_excerpts,
-            glossary_max_terms=glossary_max_terms,
-            glossary_max_items_per_tu=glossary_max_items_per_tu,
-            checkpoint_every=checkpoint_every,
-            hard_failure_repair_rounds=hard_failure_repair_rounds,
-            max_tus=max_tus,
         )
@@ -3,31 +3,59 @@ from __future__ import annotations
 import json
 import re
 from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from typing import Any
 
 from doctranslator.ir import TranslationUnit
-from doctranslator.sentinels import ANY_SENTINEL_RE
+from doctranslator.sentinels import ANY_SENTINEL_RE, _strip_sentinels
 
 
+_WS_RE = re.compile(r"\s+")
 _CJK_RE = re.compile(r"[\u4e00-\u9fff]")
 _LATIN_RE = re.compile(r"[A-Za-z]")
 _LATIN_EXT_RE = re.compile(r"[\u00C0-\u024F]")
-_DEVANAGARI_RE = re.compile(r"[\u0900-\u097F]")
-_BENGALI_RE = re.compile(r"[\u0980-\u09FF]")
-_ARABIC_RE = re.compile(r"[\u0600-\u06FF]")
-_CYRILLIC_RE = re.compile(r"[\u0400-\u04FF]")
-_GREEK_RE = re.compile(r"[\u0370-\u03FF]")
-_HEBREW_RE = re.compile(r"[\u0590-\u05FF]")
-_THAI_RE = re.compile(r"[\u0E00-\u0E7F]")
-_HANGUL_RE = re.compile(r"[\uAC00-\uD7AF]")
-_HIRAGANA_RE = re.compile(r"[\u3040-\u309F]")
-_KATAKANA_RE = re.compile(r"[\u30A0-\u30FF]")
+# Scripts that rule out en<->zh: Devanagari, Bengali, Arabic, Cyrillic, Greek, Hebrew, Thai,
+# Hangul, Hiragana, Katakana. The ranges are disjoint, so one class counts them all in one pass.
+_OTHER_SCRIPT_RE = re.compile(
+    r"[\u0900-\u097F\u0980-\u09FF\u0600-\u06FF\u0400-\u04FF\u0370-\u03FF"
+    r"\u0590-\u05FF\u0E00-\u0E7F\uAC00-\uD7AF\u3040-\u309F\u30A0-\u30FF]"
+)
+
+# ASCII bytes that are not A-Z/a-z; deleting them from an ASCII-encoded string leaves only Latin letters.
+_ASCII_NON_LATIN = bytes(b for b in range(128) if not (65 <= b <= 90 or 97 <= b <= 122))
 
 _NUMBER_TOKEN_RE = re.compile(r"(?<!\d)\d+(?:[.,]\d+)*(?:-\d+(?:[.,]\d+)*)?(?!\d)")
+# Same pattern for ASCII input: bytes matching skips the Unicode machinery, and ASCII text
+# without any digit needs no regex pass at all.
+_NUMBER_TOKEN_BYTES_RE = re.compile(_NUMBER_TOKEN_RE.pattern.encode("ascii"))
+_ASCII_NON_DIGIT = bytes(b for b in range(128) if not 48 <= b <= 57)
 _NUMBER_VALUE_RE = re.compile(r"^\d+(?:[.,]\d+)*(?:-\d+(?:[.,]\d+)*)?$")
 
 _SCOPE_TYPE_RE = re.compile(r"#(w:p|a:p|w:lvlText)@")
 
-_EN_COMMON_WORDS = {
+_JSON_DECODER = json.JSONDecoder()
+# orjson turns integer literals of 64 bits or more into floats; raw_decode() keeps them exact.
+_LONG_DIGITS_RE = re.compile(r"\d{19}")
+
+
+def _import_orjson() -> Any:
+    try:
+        import orjson  # type: ignore[import-not-found]
+    except Exception:  # noqa: BLE001
+        return None
+    return orjson
+
+
+_ORJSON = _import_orjson()
+
+# Glossaries are built once per document and then consulted for every TU; keep the
+# longest-key-first ordering around instead of re-sorting the whole glossary per call.
+# Entries hold a reference to the dict so its id() cannot be recycled while cached.
+_GLOSSARY_SORTED_CACHE: dict[int, tuple[dict[str, str], list[tuple[str, str]]]] = {}
+_GLOSSARY_SORTED_CACHE_MAX = 8
+
+_EN_COMMON_WORDS = frozenset({
     "a",
     "an",
     "and",
@@ -63,9 +91,14 @@ _EN_COMMON_WORDS = {
     "under",
     "will",
     "with",
-}
+})
+
+# Maps every byte except ASCII letters to a space so words fall out of bytes.split().
+_ASCII_NONLETTER_TO_SPACE = bytes(
+    b if 0x41 <= b <= 0x5A or 0x61 <= b <= 0x7A else 0x20 for b in range(256)
+)
 
-_ENTITY_STOPWORDS = {
+_ENTITY_STOPWORDS = frozenset({
     "is",
     "are",
     "was",
@@ -90,7 +123,7 @@ _ENTITY_STOPWORDS = {
     "may",
     "must",
     "subject",
-}
+})
 
 _ENTITY_SUFFIX_RE = re.compile(
     r"\b("
@@ -100,19 +133,14 @@ _ENTITY_SUFFIX_RE = re.compile(
     flags=re.IGNORECASE,
 )
 
-_OTHER_SCRIPT_RES = (
-    _DEVANAGARI_RE,
-    _BENGALI_RE,
-    _ARABIC_RE,
-    _CYRILLIC_RE,
-    _GREEK_RE,
-    _HEBREW_RE,
-    _THAI_RE,
-    _HANGUL_RE,
-    _HIRAGANA_RE,
-    _KATAKANA_RE,
+# Every _ENTITY_SUFFIX_RE alternative contains one of these lowercase literals.
+_ENTITY_SUFFIX_CORES = (
+    "ag", "inc", "co.", "ltd", "corp", "company", "limited", "llc", "plc", "gmbh",
+    "s.a.", "s.r.l.", "l.l.c.", "n.a.", "n.v.", "bv", "b.v.",
 )
 
+_ENTITY_WORD_RE = re.compile(r"[A-Za-z][A-Za-z'.]{1,}")
+
 
 def _scope_type(scope_key: str) -> str:
     m = _SCOPE_TYPE_RE.search(scope_key)
@@ -124,7 +152,7 @@ def _preview_for_log(text: str, max_chars: int) -> str:
         return ""
     clean = text.replace("\r", "\\r").replace("\n", "\\n")
     clean = ANY_SENTINEL_RE.sub(lambda m: f"<{m.group(0)[1:-1]}>", clean)
-    clean = re.sub(r"\s+", " ", clean).strip()
+    clean = _WS_RE.sub(" ", clean).strip()
     if max_chars > 0 and len(clean) > max_chars:
         return clean[: max(0, max_chars - 3)] + "..."
     return clean
@@ -136,14 +164,75 @@ def _try_extract_json_obj(text: str) -> dict | None:
     start = text.find("{")
     if start < 0:
         return None
+    if _ORJSON is not None:
+        # Model replies are usually just the object; if everything up to the last "}" parses
+        # as one document, it is exactly the value raw_decode() would return.
+        candidate = text[start : text.rfind("}") + 1]
+        if _LONG_DIGITS_RE.search(candidate) is None:
+            try:
+                obj = _ORJSON.loads(candidate)
+            except Exception:  # noqa: BLE001
+                pass
+            else:
+                return obj if isinstance(obj, dict) else None
     try:
-        decoder = json.JSONDecoder()
-        obj, _end = decoder.raw_decode(text[start:])
+        # raw_decode() takes the start index directly; no need to copy the tail.
+        obj, _end = _JSON_DECODER.raw_decode(text, start)
     except Exception:  # noqa: BLE001
         return None
     return obj if isinstance(obj, dict) else None
 
 
+def _glossary_items_by_key_len(glossary: dict[str, str]) -> list[tuple[str, str]]:
+    cached = _GLOSSARY_SORTED_CACHE.get(id(glossary))
+    if cached is not None and cached[0] is glossary and len(cached[1]) == len(glossary):
+        return cached[1]
+    items = sorted(glossary.items(), key=lambda kv: len(str(kv[0])), reverse=True)
+    if len(_GLOSSARY_SORTED_CACHE) >= _GLOSSARY_SORTED_CACHE_MAX:
+        _GLOSSARY_SORTED_CACHE.clear()
+    _GLOSSARY_SORTED_CACHE[id(glossary)] = (glossary, items)
+    return items
+
+
+@lru_cache(maxsize=8192)
+def _icase_pat(term: str) -> re.Pattern[str]:
+    # Glossary terms are matched against every TU; re's own cache (512 entries) thrashes on big glossaries.
+    return re.compile(re.escape(term), re.IGNORECASE)
+
+
+def _local_glossary_lines(
+    glossary: dict[str, str] | None, *, text: str, max_items: int, exact_non_alpha: bool = False
+) -> str | None:
+    # Glossary entries whose source term occurs in `text`, longest terms first. With
+    # exact_non_alpha, terms without letters (codes, numbers) must match case-sensitively as is.
+    if not glossary or not text or max_items <= 0:
+        return None
+    src_plain = _strip_sentinels(text)
+    # For ASCII on both sides a lowercase substring test is exactly the IGNORECASE match, minus the regex.
+    src_low = src_plain.lower() if src_plain.isascii() else None
+    matched: list[tuple[str, str]] = []
+    for k, v in _glossary_items_by_key_len(glossary):
+        ks = str(k).strip()
+        vs = str(v).strip()
+        if not ks or not vs:
+            continue
+        if exact_non_alpha and not any(ch.isalpha() for ch in ks):
+            if ks not in src_plain:
+                continue
+        elif src_low is not None and ks.isascii():
+            if ks.lower() not in src_low:
+                continue
+        elif _icase_pat(ks).search(src_plain) is None:
+            continue
+        matched.append((ks, vs))
+        if len(matched) >= max_items:
+            break
+    if not matched:
+        return None
+    return "\n".join([f"- {k} -> {v}" for k, v in matched])
+
+
+@lru_cache(maxsize=32)
 def _normalize_lang(code: str | None) -> str | None:
     if not code:
         return None
@@ -155,6 +244,7 @@ def _normalize_lang(code: str | None) -> str | None:
     return None
 
 
+@lru_cache(maxsize=32)
 def _lang_prompt_name(code: str) -> str:
     c = (code or "").strip().lower().replace("_", "-")
     if c.startswith("en"):
@@ -164,6 +254,7 @@ def _lang_prompt_name(code: str) -> str:
     return code
 
 
+@lru_cache(maxsize=32)
 def _lang_prompt_native(code: str) -> str:
     c = (code or "").strip().lower().replace("_", "-")
     if c.startswith("en"):
@@ -173,24 +264,55 @@ def _lang_prompt_native(code: str) -> str:
     return code
 
 
+def _source_plain(tu: TranslationUnit) -> str:
+    # Sentinel-free source text; validation, sanitizers and logging all need it for the same TU.
+    return tu.derived("source_plain", tu.source_surface, _strip_sentinels)
+
+
 def _text_for_lang(text: str) -> str:
     if not text:
         return ""
     t = ANY_SENTINEL_RE.sub(" ", text)
-    t = re.sub(r"\s+", " ", t).strip()
+    t = _WS_RE.sub(" ", t).strip()
     return t
 
 
-def _other_script_count(text: str) -> int:
+def _script_counts(text: str) -> tuple[int, int, int]:
+    # (latin, latin_ext, cjk) counts without materializing match lists.
     if not text:
+        return (0, 0, 0)
+    if text.isascii():
+        return (len(text.encode("ascii").translate(None, _ASCII_NON_LATIN)), 0, 0)
+    # [A-Za-z] is ASCII-only, so dropping non-ASCII chars before the byte count is exact.
+    latin = len(text.encode("ascii", "ignore").translate(None, _ASCII_NON_LATIN))
+    return (latin, _LATIN_EXT_RE.subn("", text)[1], _CJK_RE.subn("", text)[1])
+
+
+def _other_script_count(text: str) -> int:
+    if not text or text.isascii():
         return 0
-    return sum(len(rx.findall(text)) for rx in _OTHER_SCRIPT_RES)
+    return _OTHER_SCRIPT_RE.subn("", text)[1]
+
+
+def _build_lang_census(source_surface: str) -> tuple[str, int, int, int, int]:
+    t = _text_for_lang(source_surface)
+    latin, latin_ext, cjk = _script_counts(t)
+    return (t, latin, latin_ext, cjk, _other_script_count(t))
+
+
+def _lang_census(tu: TranslationUnit) -> tuple[str, int, int, int, int]:
+    # (text, latin, latin_ext, cjk, other) for the source; shared by language detection and every
+    # _should_translate_tu() call on the TU (translation, review, each hard-failure scan).
+    return tu.derived("lang_census", tu.source_surface, _build_lang_census)
 
 
 def _looks_like_english(text: str) -> bool:
     if not text:
         return False
-    words = re.findall(r"[A-Za-z]{2,}", text.lower())
+    # Same words as re.findall(r"[A-Za-z]{2,}", text.lower()); non-ASCII chars become "?"
+    # and therefore separators.
+    low = text.lower().encode("ascii", "replace").translate(_ASCII_NONLETTER_TO_SPACE)
+    words = [w for w in low.decode("ascii").split() if len(w) > 1]
     if not words:
         return False
     common_hits = sum(1 for w in words if w in _EN_COMMON_WORDS)
@@ -204,12 +326,18 @@ def _looks_like_english(text: str) -> bool:
 def _looks_like_entity_name(text: str) -> bool:
     if not text:
         return False
-    t = re.sub(r"\s+", " ", text).strip()
+    t = _WS_RE.sub(" ", text).strip()
     if not t or len(t) > 120:
         return False
+    # Cheap substring prefilter; only ASCII text, since IGNORECASE also folds a few
+    # non-ASCII letters (e.g. U+017F, U+0131) onto the suffix letters.
+    if t.isascii():
+        tl = t.lower()
+        if not any(core in tl for core in _ENTITY_SUFFIX_CORES):
+            return False
     if not _ENTITY_SUFFIX_RE.search(t):
         return False
-    words = re.findall(r"[A-Za-z][A-Za-z'.]{1,}", t)
+    words = _ENTITY_WORD_RE.findall(t)
     if not words:
         return False
     stop_hits = sum(1 for w in words if w.lower().strip(".") in _ENTITY_STOPWORDS and w.lower() != "and")
@@ -240,13 +368,13 @@ def _looks_like_entity_name(text: str) -> bool:
 
 
 def _detect_language_pair_from_tus(tus: list[TranslationUnit]) -> tuple[str, str, str] | None:
-    preferred = [
+    # Only the first 200 body paragraphs are sampled; stop filtering once they are found.
+    preferred = (
         tu
         for tu in tus
-        if tu.part_name.endswith("word/document.xml") and _scope_type(tu.scope_key) == "w:p" and tu.source_surface
-    ]
-    base = preferred if preferred else tus
-    samples = base[: min(200, len(base))]
+        if tu.part_name.endswith("word/document.xml") and "#w:p@" in tu.scope_key and tu.source_surface
+    )
+    samples = list(islice(preferred, 200)) or islice(tus, 200)
 
     total_cjk = 0
     total_latin = 0
@@ -255,15 +383,13 @@ def _detect_language_pair_from_tus(tus: list[TranslationUnit]) -> tuple[str, str
     en_votes = 0
     zh_votes = 0
     unknown_votes = 0
+    sampled = 0
 
     for tu in samples:
-        t = _text_for_lang(tu.source_surface)
+        t, latin, latin_ext, cjk, other = _lang_census(tu)
         if not t:
             continue
-        cjk = len(_CJK_RE.findall(t))
-        latin = len(_LATIN_RE.findall(t))
-        latin_ext = len(_LATIN_EXT_RE.findall(t))
-        other = _other_script_count(t)
+        sampled += 1
 
         total_cjk += cjk
         total_latin += latin
@@ -292,7 +418,7 @@ def _detect_language_pair_from_tus(tus: list[TranslationUnit]) -> tuple[str, str
 
     detail = (
         "Auto language detect (en<->zh only): "
-        f"en_votes={en_votes} zh_votes={zh_votes} unknown={unknown_votes} "
+        f"sampled={sampled} en_votes={en_votes} zh_votes={zh_votes} unknown={unknown_votes} "
         f"chars(cjk={total_cjk} latin={total_latin} latin_ext={total_latin_ext} other={total_other})"
     )
 
@@ -321,20 +447,20 @@ def _detect_language_pair_from_tus(tus: list[TranslationUnit]) -> tuple[str, str
     return ("en", "zh", detail + " decision=en->zh(weak_char)")
 
 
+def _is_sentinel_only(frozen_surface: str | None) -> bool:
+    return not ANY_SENTINEL_RE.sub("", frozen_surface or "").strip()
+
+
 def _should_translate_tu(tu: TranslationUnit, source_lang: str) -> tuple[bool, str]:
-    t = _text_for_lang(tu.source_surface)
-    if not t:
-        return (False, "empty")
     # If the TU is composed purely of sentinel tokens (e.g. a frozen trademark/URL/leader),
     # there is nothing to translate. Keep the frozen surface unchanged so it can be
     # projected back to Word runs without any placeholder drift.
-    if not ANY_SENTINEL_RE.sub("", tu.frozen_surface or "").strip():
-        return (False, "sentinel_only")
-
-    other = _other_script_count(t)
-    cjk = len(_CJK_RE.findall(t))
-    latin = len(_LATIN_RE.findall(t))
-    latin_ext = len(_LATIN_EXT_RE.findall(t))
+    # Checked first so such TUs never pay for the script census.
+    if tu.derived("sentinel_only", tu.frozen_surface, _is_sentinel_only):
+        return (False, "sentinel_only" if _text_for_lang(tu.source_surface) else "empty")
+    t, latin, latin_ext, cjk, other = _lang_census(tu)
+    if not t:
+        return (False, "empty")
 
     if other > 0:
         signal = cjk + latin + latin_ext
@@ -360,7 +486,16 @@ def _should_translate_tu(tu: TranslationUnit, source_lang: str) -> tuple[bool, s
     return (True, "ok")
 
 
-def number_tokens_in_text(text: str) -> Counter[str]:
-    plain = ANY_SENTINEL_RE.sub(" ", text or "")
+def _count_number_tokens(plain: str) -> Counter[str]:
+    # Counter(findall) counts in C; a per-match Python loop over finditer is slower here.
+    if plain.isascii():
+        raw = plain.encode("ascii")
+        if not raw.translate(None, _ASCII_NON_DIGIT):
+            return Counter()
+        return Counter([tok.decode("ascii") for tok in _NUMBER_TOKEN_BYTES_RE.findall(raw)])
     return Counter(_NUMBER_TOKEN_RE.findall(plain))
 
+
+def number_tokens_in_text(text: str) -> Counter[str]:
+    return _count_number_tokens(_strip_sentinels(text or ""))
+
@@ -1,7 +1,7 @@
 from __future__ import annotations
 import threading
 import time
-from collections import Counter
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Callable
 
@@ -11,20 +11,28 @@ from doctranslator.chunking import _detect_stitch_duplicate_chunks, _split_text_
 from doctranslator.hierarchy import ParagraphContext
 from doctranslator.ir import TranslationUnit
 from doctranslator.models import ChatModel, TranslateGemmaModel
-from doctranslator.protocol import normalize_candidate_translation, _split_by_sentinels, _split_edge_ws, _validate_sentinels
+from doctranslator.protocol import normalize_candidate_translation, _frozen_parts, _split_edge_ws, _validate_sentinels
 from doctranslator.quality import hard_issues, quality_issues
-from doctranslator.sentinels import ANY_SENTINEL_RE, decode_sentinels_from_model
+from doctranslator.sentinels import decode_sentinels_from_model
 from doctranslator.textutil import (
     _lang_prompt_name,
     _lang_prompt_native,
+    _local_glossary_lines,
     _preview_for_log,
     _scope_type,
     _should_translate_tu,
+    _source_plain,
     _try_extract_json_obj,
     number_tokens_in_text,
 )
 
 
+_ASCII_LETTER_RE = re.compile(r"[A-Za-z]")
+# Output budget by source size: up to _MAX_NEW_BUCKET_EDGES[i] source tokens get _MAX_NEW_BUCKET_VALS[i].
+_MAX_NEW_BUCKET_EDGES = (16, 64, 160, 320, 640)
+_MAX_NEW_BUCKET_VALS = (64, 128, 256, 384, 512, 768)
+
+
 @dataclass(frozen=True)
 class AgentContext:
     domain: str | None = None
@@ -35,12 +43,54 @@ class AgentContext:
     glossary: dict[str, str] | None = None
 
 
-def _expand_counter(c: Counter[str]) -> list[str]:
-    out: list[str] = []
-    for k, v in c.items():
-        for _ in range(int(v)):
-            out.append(str(k))
-    return out
+class _HeartbeatMonitor:
+    # One daemon thread serves every in-flight model call instead of spawning a thread per call.
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._in_flight: dict[int, list] = {}
+        self._next_key = 0
+        self._thread: threading.Thread | None = None
+
+    def register(self, progress: object, label: str, interval: float) -> int:
+        now = time.monotonic()
+        with self._cond:
+            key = self._next_key
+            self._next_key += 1
+            # [progress, label, started_at, interval, next_due]
+            self._in_flight[key] = [progress, label, now, interval, now + interval]
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="doctranslator-heartbeat", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return key
+
+    def unregister(self, key: int) -> None:
+        with self._cond:
+            self._in_flight.pop(key, None)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._in_flight:
+                    self._cond.wait()
+                now = time.monotonic()
+                next_due = min(entry[4] for entry in self._in_flight.values())
+                if next_due > now:
+                    self._cond.wait(next_due - now)
+                    continue
+                due: list[tuple[int, object, str, float]] = []
+                for key, entry in self._in_flight.items():
+                    if entry[4] <= now:
+                        entry[4] = now + entry[3]
+                        due.append((key, entry[0], entry[1], now - entry[2]))
+            for key, progress, label, elapsed in due:
+                try:
+                    progress.info(f"{label} running... elapsed={elapsed:.1f}s")
+                except Exception:  # noqa: BLE001
+                    self.unregister(key)
+
+
+_HEARTBEAT = _HeartbeatMonitor()
 
 
 def _run_with_heartbeat(
@@ -50,52 +100,13 @@ def _run_with_heartbeat(
     heartbeat_seconds: float,
     fn: Callable[[], str],
 ) -> str:
-    done = threading.Event()
-    started = time.time()
-
-    def worker() -> None:
-        while not done.wait(max(0.1, float(heartbeat_seconds))):
-            try:
-                elapsed = time.time() - started
-                progress.info(f"{label} running... elapsed={elapsed:.1f}s")
-            except Exception:  # noqa: BLE001
-                return
-
-    t: threading.Thread | None = None
-    if heartbeat_seconds and heartbeat_seconds > 0:
-        t = threading.Thread(target=worker, daemon=True)
-        t.start()
+    if not heartbeat_seconds or heartbeat_seconds <= 0:
+        return fn()
+    key = _HEARTBEAT.register(progress, label, max(0.1, float(heartbeat_seconds)))
     try:
         return fn()
     finally:
-        done.set()
-        if t is not None:
-            t.join(timeout=0.05)
-
-
-def _local_glossary_lines(glossary: dict[str, str] | None, *, text: str, max_items: int) -> str | None:
-    if not glossary or not text or max_items <= 0:
-        return None
-    src_plain = ANY_SENTINEL_RE.sub(" ", text)
-    matched: list[tuple[str, str]] = []
-    items = sorted(glossary.items(), key=lambda kv: len(str(kv[0])), reverse=True)
-    for k, v in items:
-        ks = str(k).strip()
-        vs = str(v).strip()
-        if not ks or not vs:
-            continue
-        if any(ch.isalpha() for ch in ks):
-            if ks and (re.search(re.escape(ks), src_plain, flags=re.IGNORECASE) is None):
-                continue
-        else:
-            if ks not in src_plain:
-                continue
-        matched.append((ks, vs))
-        if len(matched) >= max_items:
-            break
-    if not matched:
-        return None
-    return "\n".join([f"- {k} -> {v}" for k, v in matched])
+        _HEARTBEAT.unregister(key)
 
 
 def _neighbor_texts(tus: list[TranslationUnit], idx0: int) -> tuple[str | None, str | None]:
@@ -108,36 +119,21 @@ def _max_new_for_tokens(src_tokens: int, cap: int) -> int:
     cap = int(cap)
     if cap <= 0:
         cap = 1024
-    if src_tokens <= 16:
-        return min(cap, 64)
-    if src_tokens <= 64:
-        return min(cap, 128)
-    if src_tokens <= 160:
-        return min(cap, 256)
-    if src_tokens <= 320:
-        return min(cap, 384)
-    if src_tokens <= 640:
-        return min(cap, 512)
-    return min(cap, 768)
+    if 0 < src_tokens <= 4:
+        # A handful of source tokens never needs 64 new ones; a tight cap stops runaway decodes early.
+        return min(cap, max(16, src_tokens * 4))
+    return min(cap, _MAX_NEW_BUCKET_VALS[bisect_left(_MAX_NEW_BUCKET_EDGES, src_tokens)])
 
 
-def _agent_instruction_json(
+def _agent_ctx_block(
     *,
-    agent: ChatModel,
-    src_name: str,
-    tgt_name: str,
-    tgt_native: str,
-    seg_src: str,
-    bad_out: str,
-    issues: list[str],
-    protocol_error: str | None,
     ctx: AgentContext,
     struct_hint: str | None,
     neighbor_prev: str | None,
     neighbor_next: str | None,
     glossary_lines: str | None,
-    max_new_tokens: int,
-) -> str | None:
+) -> str:
+    # Context section shared by the agent prompts; it is fixed for a TU, so build it once per TU.
     ctx_lines: list[str] = []
     if ctx.domain:
         ctx_lines.append(f"domain={ctx.domain}")
@@ -158,7 +154,22 @@ def _agent_instruction_json(
         ctx_block += "Prev source paragraph (context only):\n" + str(neighbor_prev).strip()[:420] + "\n\n"
     if neighbor_next:
         ctx_block += "Next source paragraph (context only):\n" + str(neighbor_next).strip()[:420] + "\n\n"
+    return ctx_block
 
+
+def _agent_instruction_json(
+    *,
+    agent: ChatModel,
+    src_name: str,
+    tgt_name: str,
+    tgt_native: str,
+    seg_src: str,
+    bad_out: str,
+    issues: list[str],
+    protocol_error: str | None,
+    ctx_block: str,
+    max_new_tokens: int,
+) -> str | None:
     prompt = (
         f"You are a {src_name} to {tgt_name} translation pipeline agent.\n"
         "Write ONE targeted instruction for the translation model to fix the failure.\n"
@@ -198,36 +209,10 @@ def _agent_translate_plain(
     tgt_name: str,
     tgt_native: str,
     text: str,
-    ctx: AgentContext,
-    struct_hint: str | None,
-    neighbor_prev: str | None,
-    neighbor_next: str | None,
-    glossary_lines: str | None,
+    ctx_block: str,
     max_new_tokens: int,
 ) -> str:
-    ctx_lines: list[str] = []
-    if ctx.domain:
-        ctx_lines.append(f"domain={ctx.domain}")
-    if ctx.doc_type:
-        ctx_lines.append(f"doc_type={ctx.doc_type}")
-    if ctx.target_style:
-        ctx_lines.append(f"target_style={ctx.target_style}")
-    ctx_block = ("Document context: " + " | ".join(ctx_lines) + "\n\n") if ctx_lines else ""
-    if ctx.style_guide:
-        ctx_block += "Style guide (must follow):\n" + str(ctx.style_guide).strip()[:800] + "\n\n"
-    if glossary_lines:
-        ctx_block += "Glossary (must follow):\n" + str(glossary_lines).strip()[:800] + "\n\n"
-    if ctx.summary:
-        ctx_block += "Document summary (context only):\n" + str(ctx.summary).strip()[:800] + "\n\n"
-    if struct_hint:
-        ctx_block += "Structure hints (context only):\n" + str(struct_hint).strip()[:600] + "\n\n"
-    if neighbor_prev:
-        ctx_block += "Prev source paragraph (context only):\n" + str(neighbor_prev).strip()[:420] + "\n\n"
-    if neighbor_next:
-        ctx_block += "Next source paragraph (context only):\n" + str(neighbor_next).strip()[:420] + "\n\n"
-
-    nums = _expand_counter(number_tokens_in_text(text))
-    nums_hint = ", ".join(nums) if nums else "(none)"
+    nums_hint = ", ".join(number_tokens_in_text(text).elements()) or "(none)"
 
     prompt = (
         f"You are a professional {src_name} to {tgt_name} translator.\n"
@@ -255,11 +240,7 @@ def _agent_translate_tu_skeleton(
     tu: TranslationUnit,
     source_lang: str,
     target_lang: str,
-    ctx: AgentContext,
-    para_context: ParagraphContext | None,
-    neighbor_prev: str | None,
-    neighbor_next: str | None,
-    glossary_lines: str | None,
+    ctx_block: str,
     heartbeat_seconds: float,
     max_input_tokens: int,
     max_new_tokens_cap: int,
@@ -267,31 +248,32 @@ def _agent_translate_tu_skeleton(
     src_name = _lang_prompt_name(source_lang)
     tgt_name = _lang_prompt_name(target_lang)
     tgt_native = _lang_prompt_native(target_lang)
-    struct_hint = para_context.format_for_prompt() if para_context is not None else None
 
     max_seg_tokens = int(max_input_tokens or 0)
     if max_seg_tokens <= 0:
         max_seg_tokens = 1800
     max_seg_tokens = max(256, min(max_seg_tokens, max(256, int(agent.n_ctx) - 700)))
 
-    parts = _split_by_sentinels(tu.frozen_surface)
     out_parts: list[str] = []
-    for part in parts:
-        if ANY_SENTINEL_RE.fullmatch(part) is not None:
+    # _frozen_parts() alternates text and sentinel parts, so every odd part is a sentinel.
+    for pi, part in enumerate(_frozen_parts(tu)):
+        if pi % 2:
             out_parts.append(part)
             continue
         pre, core, suf = _split_edge_ws(part)
-        if not core.strip():
+        if not core.strip() or (core.isascii() and _ASCII_LETTER_RE.search(core) is None):
+            # Whitespace, or ASCII digits/punctuation only: nothing for the model to translate.
+            # Fullwidth punctuation such as "（1）" or "、" still goes to the model.
             out_parts.append(part)
             continue
 
-        chunks = _split_text_to_fit_tokens(core, count_tokens=agent.count_tokens, max_tokens=max_seg_tokens)
+        counted_chunks = _split_text_to_fit_tokens(core, count_tokens=agent.count_tokens, max_tokens=max_seg_tokens)
         out_chunks: list[str] = []
-        for ch in chunks:
+        for ch, ch_tokens in counted_chunks:
             if not ch.strip():
                 out_chunks.append(ch)
                 continue
-            src_tokens = agent.count_tokens(ch) or 0
+            src_tokens = ch_tokens or agent.count_tokens(ch) or 0
             seg_max_new = _max_new_for_tokens(src_tokens, max_new_tokens_cap)
 
             def do_translate() -> str:
@@ -301,11 +283,7 @@ def _agent_translate_tu_skeleton(
                     tgt_name=tgt_name,
                     tgt_native=tgt_native,
                     text=ch,
-                    ctx=ctx,
-                    struct_hint=struct_hint,
-                    neighbor_prev=neighbor_prev,
-                    neighbor_next=neighbor_next,
-                    glossary_lines=glossary_lines,
+                    ctx_block=ctx_block,
                     max_new_tokens=seg_max_new,
                 )
 
@@ -320,7 +298,8 @@ def _agent_translate_tu_skeleton(
 
         out_parts.append(pre + "".join(out_chunks) + suf)
 
-    stitched = decode_sentinels_from_model("".join(out_parts))
+    # Chunks were decoded as they came back; everything else in out_parts is source text/sentinels.
+    stitched = "".join(out_parts)
     normalized, _ws = normalize_candidate_translation(tu, stitched, source_lang=source_lang, target_lang=target_lang)
     return normalized
 
@@ -342,16 +321,14 @@ def _translate_tu_skeleton(
     max_new_tokens_cap: int,
     glossary_max_items_per_tu: int,
 ) -> tuple[str, list[str], str | None]:
-    src_name = _lang_prompt_name(source_lang)
-    tgt_name = _lang_prompt_name(target_lang)
-    tgt_native = _lang_prompt_native(target_lang)
-
-    struct_hint = para_context.format_for_prompt() if para_context is not None else None
-    neighbor_prev, neighbor_next = _neighbor_texts(tus, idx0)
-    glossary_lines = _local_glossary_lines(ctx.glossary, text=tu.source_surface, max_items=glossary_max_items_per_tu)
+    # Prompt context is built when the first segment is dispatched; letterless TUs never need it.
+    struct_hint: str | None = None
+    neighbor_prev: str | None = None
+    neighbor_next: str | None = None
+    glossary_lines: str | None = None
+    prompt_ctx_ready = False
 
     # Token-preserving skeleton: translate only plain segments between sentinels, keep sentinels unchanged.
-    parts = _split_by_sentinels(tu.frozen_surface)
     out_parts: list[str] = []
     chunk_src: list[str] = []
     chunk_out: list[str] = []
@@ -362,30 +339,41 @@ def _translate_tu_skeleton(
     # Leave headroom for prompt and output.
     max_seg_tokens = max(256, min(max_seg_tokens, max(256, int(model.n_ctx) - 600)))
 
-    for part in parts:
-        if ANY_SENTINEL_RE.fullmatch(part) is not None:
+    # _frozen_parts() alternates text and sentinel parts, so every odd part is a sentinel.
+    for pi, part in enumerate(_frozen_parts(tu)):
+        if pi % 2:
             out_parts.append(part)
             continue
 
         pre, core, suf = _split_edge_ws(part)
-        if not core.strip():
+        if not core.strip() or (core.isascii() and _ASCII_LETTER_RE.search(core) is None):
+            # Whitespace, or ASCII digits/punctuation only: nothing for the model to translate.
+            # Fullwidth punctuation such as "（1）" or "、" still goes to the model.
             out_parts.append(part)
             continue
 
-        chunks = _split_text_to_fit_tokens(core, count_tokens=model.count_tokens, max_tokens=max_seg_tokens)
-        chunk_src.extend(chunks)
+        counted_chunks = _split_text_to_fit_tokens(core, count_tokens=model.count_tokens, max_tokens=max_seg_tokens)
+        chunk_src.extend(ch for ch, _n in counted_chunks)
         out_chunks: list[str] = []
-        for ch in chunks:
+        for ch, ch_tokens in counted_chunks:
             if not ch.strip():
                 out_chunks.append(ch)
                 continue
 
-            src_tokens = model.count_tokens(ch) or 0
+            if not prompt_ctx_ready:
+                struct_hint = para_context.format_for_prompt() if para_context is not None else None
+                neighbor_prev, neighbor_next = _neighbor_texts(tus, idx0)
+                glossary_lines = _local_glossary_lines(
+                    ctx.glossary, text=tu.source_surface, max_items=glossary_max_items_per_tu, exact_non_alpha=True
+                )
+                prompt_ctx_ready = True
+
+            src_tokens = ch_tokens or model.count_tokens(ch) or 0
             seg_max_new = _max_new_for_tokens(src_tokens, max_new_tokens_cap)
             label = f"TG TU#{tu.tu_id} seg"
 
             def do_translate() -> str:
-                required_numbers = _expand_counter(number_tokens_in_text(ch))
+                required_numbers = list(number_tokens_in_text(ch).elements())
                 return model.translate_text(
                     text=ch,
                     source_lang_code=source_lang,
@@ -418,8 +406,8 @@ def _translate_tu_skeleton(
         chunk_out.extend(out_chunks)
         out_parts.append(pre + out_core + suf)
 
+    # Chunks were decoded as they came back; everything else in out_parts is source text/sentinels.
     stitched = "".join(out_parts)
-    stitched = decode_sentinels_from_model(stitched)
     normalized, ws_flags = normalize_candidate_translation(tu, stitched, source_lang=source_lang, target_lang=target_lang)
 
     protocol_error: str | None = None
@@ -482,7 +470,7 @@ def translate_units(
             continue
 
         para_ctx = para_contexts.get(tu.tu_id) if para_contexts is not None else None
-        src_plain = ANY_SENTINEL_RE.sub(" ", tu.source_surface)
+        src_plain = _source_plain(tu)
         src_chars = len(src_plain)
 
         if i <= 8 or i % max(1, int(log_tu_every)) == 0:
@@ -604,7 +592,16 @@ def _attempt_agent_repairs(
 
     struct_hint = para_ctx.format_for_prompt() if para_ctx is not None else None
     neighbor_prev, neighbor_next = _neighbor_texts(tus, idx0)
-    glossary_lines = _local_glossary_lines(ctx.glossary, text=tu.source_surface, max_items=glossary_max_items_per_tu)
+    glossary_lines = _local_glossary_lines(
+        ctx.glossary, text=tu.source_surface, max_items=glossary_max_items_per_tu, exact_non_alpha=True
+    )
+    agent_ctx_block = _agent_ctx_block(
+        ctx=ctx,
+        struct_hint=struct_hint,
+        neighbor_prev=neighbor_prev,
+        neighbor_next=neighbor_next,
+        glossary_lines=glossary_lines,
+    )
 
     # 1) Agent produces a targeted instruction, we retry TranslateGemma once.
     instr = _agent_instruction_json(
@@ -616,16 +613,12 @@ def _attempt_agent_repairs(
         bad_out=initial_bad,
         issues=initial_issues,
         protocol_error=initial_protocol_error,
-        ctx=ctx,
-        struct_hint=struct_hint,
-        neighbor_prev=neighbor_prev,
-        neighbor_next=neighbor_next,
-        glossary_lines=glossary_lines,
+        ctx_block=agent_ctx_block,
         max_new_tokens=min(int(max_new_tokens or 1024), 256),
     )
 
     if instr:
-        required_numbers = _expand_counter(number_tokens_in_text(tu.source_surface))
+        required_numbers = list(number_tokens_in_text(_source_plain(tu)).elements())
         try:
             raw = _run_with_heartbeat(
                 progress=progress,
@@ -672,11 +665,7 @@ def _attempt_agent_repairs(
             tu=tu,
             source_lang=source_lang,
             target_lang=target_lang,
-            ctx=ctx,
-            para_context=para_ctx,
-            neighbor_prev=neighbor_prev,
-            neighbor_next=neighbor_next,
-            glossary_lines=glossary_lines,
+            ctx_block=agent_ctx_block,
             heartbeat_seconds=heartbeat_seconds,
             max_input_tokens=max_input_tokens,
             max_new_tokens_cap=min(int(max_new_tokens or 1024), 768),
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import re
+import sys
+from itertools import chain
+from pathlib import Path
+from typing import Iterator
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+# Sentinels and whitespace runs (NBSP included: `\s` is Unicode-aware) collapse to one space in a single pass.
+_NORM_RE = re.compile(r"(?:<<MT_[A-Za-z0-9_:\\-]{1,64}>>|\s)+")
+
+
+def norm(s: str) -> str:
+    return _NORM_RE.sub(" ", s).strip()
+
+
+def _iter_python_docx_paragraphs(d) -> Iterator:
+    # Body paragraphs, then table cells, then each section's header and footer.
+    return chain(
+        d.paragraphs,
+        chain.from_iterable(cell.paragraphs for table in d.tables for row in table.rows for cell in row.cells),
+        chain.from_iterable(
+            (*section.header.paragraphs, *section.footer.paragraphs) for section in d.sections
+        ),
+    )
+
+
+def extract_python_docx(docx_path: Path) -> list[str]:
+    py_docx_src = REPO_ROOT / "python-docx-master" / "src"
+    if str(py_docx_src) not in sys.path:
+        sys.path.insert(0, str(py_docx_src))
+    import docx  # type: ignore
+
+    d = docx.Document(str(docx_path))
+    return [t for t in map(norm, (p.text or "" for p in _iter_python_docx_paragraphs(d))) if t]
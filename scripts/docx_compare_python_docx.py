@@ -4,12 +4,15 @@ import argparse
 import re
 import sys
 from collections import Counter
+from itertools import islice
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from _docx_compare_util import extract_python_docx, norm  # noqa: E402
+
 try:
     sys.stdout.reconfigure(encoding="utf-8", errors="backslashreplace")
     sys.stderr.reconfigure(encoding="utf-8", errors="backslashreplace")
@@ -17,48 +20,16 @@ except Exception:
     pass
 
 
-def _norm(s: str) -> str:
-    s = s.replace("\u00a0", " ")
-    s = re.sub(r"<<MT_[A-Za-z0-9_:\\-]{1,64}>>", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-
-def _extract_python_docx(docx_path: Path) -> list[str]:
-    py_docx_src = REPO_ROOT / "python-docx-master" / "src"
-    if str(py_docx_src) not in sys.path:
-        sys.path.insert(0, str(py_docx_src))
-    import docx  # type: ignore
-
-    d = docx.Document(str(docx_path))
-    out: list[str] = []
-
-    def add_paragraphs(paragraphs) -> None:
-        for p in paragraphs:
-            t = _norm(p.text or "")
-            if t:
-                out.append(t)
-
-    add_paragraphs(d.paragraphs)
-
-    for table in d.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                add_paragraphs(cell.paragraphs)
-
-    for section in d.sections:
-        add_paragraphs(section.header.paragraphs)
-        add_paragraphs(section.footer.paragraphs)
-
-    return out
+# Any element the scope extractor collects (w:p, a:p, w:lvlText), under any prefix.
+_SCOPE_ELEMENT_BYTES_RE = re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?(?:p|lvlText)[\s/>]")
 
 
 def _extract_doctranslator_lxml(docx_path: Path) -> list[str]:
-    from doctranslator.docx_package import parse_xml_part, read_docx
+    from doctranslator.docx_package import parse_xml_part, read_docx_mapped
     from doctranslator.extract import extract_scopes_from_xml
 
     out: list[str] = []
-    with read_docx(docx_path) as zin:
+    with read_docx_mapped(docx_path) as zin:
         xml_names = [
             info.filename
             for info in zin.infolist()
@@ -68,12 +39,14 @@ def _extract_doctranslator_lxml(docx_path: Path) -> list[str]:
             key=lambda n: (0 if "word/document" in n.replace("\\", "/") else 1, n)
         )
         for name in xml_names:
-            part = parse_xml_part(name, zin.read(name))
+            xml_bytes = zin.read(name)
+            # Styles, settings, themes, rels etc. carry no paragraphs; don't build a tree for them.
+            # (UTF-16 parts can't be scanned bytewise, so they always take the full parse.)
+            if xml_bytes[:2] not in (b"\xff\xfe", b"\xfe\xff") and _SCOPE_ELEMENT_BYTES_RE.search(xml_bytes) is None:
+                continue
+            part = parse_xml_part(name, xml_bytes)
             scopes = extract_scopes_from_xml(name, part.tree)
-            for sc in scopes:
-                t = _norm((sc.surface_text or ""))
-                if t:
-                    out.append(t)
+            out.extend(t for t in map(norm, (sc.surface_text or "" for sc in scopes)) if t)
     return out
 
 
@@ -85,27 +58,28 @@ def main() -> int:
     if not args.docx.exists():
         raise FileNotFoundError(args.docx)
 
-    py = _extract_python_docx(args.docx)
+    py = extract_python_docx(args.docx)
     lx = _extract_doctranslator_lxml(args.docx)
 
     c_py = Counter(py)
     c_lx = Counter(lx)
 
-    missing = list((c_py - c_lx).elements())
-    extra = list((c_lx - c_py).elements())
+    # Only the counts and the first few examples are reported; don't expand the full multisets.
+    missing = c_py - c_lx
+    extra = c_lx - c_py
 
     print(f"python-docx paragraphs: {len(py)} (unique={len(c_py)})")
     print(f"lxml scopes:          {len(lx)} (unique={len(c_lx)})")
-    print(f"missing from lxml:    {len(missing)}")
-    print(f"extra in lxml:        {len(extra)}")
+    print(f"missing from lxml:    {missing.total()}")
+    print(f"extra in lxml:        {extra.total()}")
 
     if missing:
         print("\n[missing examples]")
-        for t in missing[:25]:
+        for t in islice(missing.elements(), 25):
             print(f"- {t}")
     if extra:
         print("\n[extra examples]")
-        for t in extra[:25]:
+        for t in islice(extra.elements(), 25):
             print(f"- {t}")
 
     return 0
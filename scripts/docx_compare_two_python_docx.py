@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import argparse
-import re
 import sys
+import xml.etree.ElementTree as ET
+import zipfile
 from collections import Counter
+from itertools import islice
 from pathlib import Path
+from typing import Iterator
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from _docx_compare_util import norm  # noqa: E402
+
 try:
     sys.stdout.reconfigure(encoding="utf-8", errors="backslashreplace")
     sys.stderr.reconfigure(encoding="utf-8", errors="backslashreplace")
@@ -17,39 +22,94 @@ except Exception:
     pass
 
 
-def _norm(s: str) -> str:
-    s = s.replace("\u00a0", " ")
-    s = re.sub(r"<<MT_[A-Za-z0-9_:\\-]{1,64}>>", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_PR = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def _iter_paragraph_texts(
+    xml_file, sections: list[tuple[str | None, str | None]] | None = None
+) -> Iterator[str]:
+    # Mirrors python-docx Paragraph.text (runs only: w:t, tab, line breaks, no-break hyphen).
+    # Nested paragraphs (text boxes) get their own buffer instead of leaking into the outer one.
+    # mc:Fallback repeats the mc:Choice content for old readers; only the Choice is read.
+    # With `sections`, each w:sectPr's default (header, footer) r:ids are collected in order.
+    buffers: list[list[str]] = []
+    in_tab_stops = 0
+    in_fallback = 0
+    for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+        tag = elem.tag
+        if tag == _MC_FALLBACK:
+            in_fallback += 1 if event == "start" else -1
+            continue
+        if in_fallback:
+            continue
+        if event == "start":
+            if tag == f"{_W}p":
+                buffers.append([])
+            elif tag == f"{_W}tabs":
+                in_tab_stops += 1
+            continue
+        if tag == f"{_W}p":
+            yield "".join(buffers.pop())
+            elem.clear()
+        elif tag == f"{_W}tabs":
+            in_tab_stops -= 1
+        elif tag == f"{_W}sectPr":
+            if sections is not None:
+                refs = {
+                    ref.tag: ref.get(_R_ID)
+                    for ref in elem
+                    if ref.tag in (f"{_W}headerReference", f"{_W}footerReference")
+                    and ref.get(f"{_W}type", "default") == "default"
+                }
+                sections.append((refs.get(f"{_W}headerReference"), refs.get(f"{_W}footerReference")))
+        elif not buffers:
+            continue
+        elif tag == f"{_W}t":
+            buffers[-1].append(elem.text or "")
+        elif tag in (f"{_W}tab", f"{_W}ptab"):
+            if not in_tab_stops:
+                buffers[-1].append("\t")
+        elif tag == f"{_W}cr":
+            buffers[-1].append("\n")
+        elif tag == f"{_W}br":
+            if elem.get(f"{_W}type", "textWrapping") == "textWrapping":
+                buffers[-1].append("\n")
+        elif tag == f"{_W}noBreakHyphen":
+            buffers[-1].append("-")
+
+
+def _document_rel_targets(zf: zipfile.ZipFile) -> dict[str, str]:
+    try:
+        data = zf.read("word/_rels/document.xml.rels")
+    except KeyError:
+        return {}
+    targets = {}
+    for rel in ET.fromstring(data).iter(f"{_PR}Relationship"):
+        target = rel.get("Target") or ""
+        targets[rel.get("Id") or ""] = target.lstrip("/") if target.startswith("/") else f"word/{target}"
+    return targets
 
 
 def _extract_python_docx(docx_path: Path) -> list[str]:
-    py_docx_src = REPO_ROOT / "python-docx-master" / "src"
-    if str(py_docx_src) not in sys.path:
-        sys.path.insert(0, str(py_docx_src))
-    import docx  # type: ignore
-
-    d = docx.Document(str(docx_path))
+    # Stream word/document.xml and the header/footer parts instead of building the python-docx
+    # object model; only the paragraph texts are compared. Not a byte-for-byte python-docx
+    # replica: text-box paragraphs count as paragraphs of their own, and each default
+    # header/footer part referenced by a section is read once (python-docx repeats linked
+    # ones per section). First-page and even-page parts are skipped, as in section.header.
     out: list[str] = []
-
-    def add_paragraphs(paragraphs) -> None:
-        for p in paragraphs:
-            t = _norm(p.text or "")
-            if t:
-                out.append(t)
-
-    add_paragraphs(d.paragraphs)
-
-    for table in d.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                add_paragraphs(cell.paragraphs)
-
-    for section in d.sections:
-        add_paragraphs(section.header.paragraphs)
-        add_paragraphs(section.footer.paragraphs)
-
+    sections: list[tuple[str | None, str | None]] = []
+    with zipfile.ZipFile(docx_path) as zf:
+        with zf.open("word/document.xml") as f:
+            out.extend(t for t in map(norm, _iter_paragraph_texts(f, sections)) if t)
+
+        targets = _document_rel_targets(zf)
+        rel_ids = dict.fromkeys(rel_id for refs in sections for rel_id in refs if rel_id)
+        for name in dict.fromkeys(targets[rel_id] for rel_id in rel_ids if rel_id in targets):
+            with zf.open(name) as f:
+                out.extend(t for t in map(norm, _iter_paragraph_texts(f)) if t)
     return out
 
 
@@ -70,21 +130,21 @@ def main() -> int:
     c_a = Counter(a)
     c_b = Counter(b)
 
-    missing = list((c_a - c_b).elements())
-    extra = list((c_b - c_a).elements())
+    missing = c_a - c_b
+    extra = c_b - c_a
 
     print(f"A paragraphs: {len(a)} (unique={len(c_a)})")
     print(f"B paragraphs: {len(b)} (unique={len(c_b)})")
-    print(f"missing from B: {len(missing)}")
-    print(f"extra in B:     {len(extra)}")
+    print(f"missing from B: {missing.total()}")
+    print(f"extra in B:     {extra.total()}")
 
     if missing:
         print("\n[missing examples]")
-        for t in missing[:25]:
+        for t in islice(missing.elements(), 25):
             print(f"- {t}")
     if extra:
         print("\n[extra examples]")
-        for t in extra[:25]:
+        for t in islice(extra.elements(), 25):
             print(f"- {t}")
 
     return 0
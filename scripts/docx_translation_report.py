@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import operator
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -12,29 +16,53 @@ if str(REPO_ROOT) not in sys.path:
 
 _CJK_RE = re.compile(r"[\u4e00-\u9fff]")
 _LATIN_RE = re.compile(r"[A-Za-z]")
+_WS_RE = re.compile(r"\s+")
 
 
-def _extract_scopes(docx_path: Path):
-    from doctranslator.docx_package import parse_xml_part, read_docx
+# Below this much XML, starting worker processes costs more than extracting the parts serially.
+_PARALLEL_MIN_XML_BYTES = 8 << 20
+
+
+def _surface_texts(name: str, tree) -> list[str]:
     from doctranslator.extract import extract_scopes_from_xml
 
-    scopes = []
-    with read_docx(docx_path) as zin:
-        xml_entries = [
-            info.filename
+    # Only the surface text is reported; it also keeps worker results picklable (no lxml nodes).
+    return [sc.surface_text or "" for sc in extract_scopes_from_xml(name, tree)]
+
+
+def _part_surface_texts(item: tuple[str, bytes]) -> list[str]:
+    from doctranslator.docx_package import parse_xml_part
+
+    name, data = item
+    return _surface_texts(name, parse_xml_part(name, data).tree)
+
+
+def _extract_scopes(docx_path: Path) -> list[str]:
+    from doctranslator.docx_package import parse_xml_stream, read_docx_mapped
+
+    with read_docx_mapped(docx_path) as zin:
+        xml_infos = [
+            info
             for info in zin.infolist()
             if info.filename.lower().endswith(".xml") and info.file_size > 0
         ]
         # Match Rust pipeline part iteration order (sorted by name).
-        xml_entries.sort()
-        for name in xml_entries:
-            part = parse_xml_part(name, zin.read(name))
-            scopes.extend(extract_scopes_from_xml(name, part.tree))
-    return scopes
+        xml_infos.sort(key=lambda info: info.filename)
+
+        if len(xml_infos) >= 4 and sum(info.file_size for info in xml_infos) >= _PARALLEL_MIN_XML_BYTES:
+            items = [(info.filename, zin.read(info.filename)) for info in xml_infos]
+            with ProcessPoolExecutor(max_workers=min(len(items), os.cpu_count() or 1)) as pool:
+                per_part = list(pool.map(_part_surface_texts, items))
+        else:
+            per_part = []
+            for info in xml_infos:
+                with zin.open(info) as fh:
+                    per_part.append(_surface_texts(info.filename, parse_xml_stream(info.filename, fh)))
+    return [text for texts in per_part for text in texts]
 
 
 def _short(s: str, n: int) -> str:
-    s = " ".join((s or "").split())
+    s = _WS_RE.sub(" ", s or "").strip()
     if len(s) <= n:
         return s
     return s[:n] + "…"
@@ -61,36 +89,35 @@ def main() -> int:
         return 2
 
     total = len(src)
-    changed = 0
-    unchanged = 0
-    src_latin = 0
-    src_latin_unchanged = 0
-    dst_has_cjk = 0
-
-    unchanged_examples = []
-    changed_examples = []
-
-    for i, (s, t) in enumerate(zip(src, dst)):
-        s_text = (s.surface_text or "").strip()
-        t_text = (t.surface_text or "").strip()
-
-        same = s_text == t_text
-        if same:
-            unchanged += 1
-        else:
-            changed += 1
-
-        if _LATIN_RE.search(s_text):
-            src_latin += 1
-            if same:
-                src_latin_unchanged += 1
-                if len(unchanged_examples) < int(args.max_show):
-                    unchanged_examples.append((i + 1, s_text, t_text))
-
-        if _CJK_RE.search(t_text):
-            dst_has_cjk += 1
-            if not same and len(changed_examples) < int(args.max_show):
-                changed_examples.append((i + 1, s_text, t_text))
+    src_texts = [s.strip() for s in src]
+    dst_texts = [t.strip() for t in dst]
+
+    # Per-scope flags in comprehension passes; the counters are plain sums over them.
+    same = [s_text == t_text for s_text, t_text in zip(src_texts, dst_texts)]
+    latin_search = _LATIN_RE.search
+    src_has_latin = [latin_search(s_text) is not None for s_text in src_texts]
+    cjk_search = _CJK_RE.search
+    dst_cjk = [cjk_search(t_text) is not None for t_text in dst_texts]
+
+    unchanged = sum(same)
+    changed = total - unchanged
+    src_latin = sum(src_has_latin)
+    src_latin_unchanged = sum(map(operator.and_, src_has_latin, same))
+    dst_has_cjk = sum(dst_cjk)
+
+    max_show = int(args.max_show)
+    unchanged_examples = list(
+        islice(
+            ((i + 1, src_texts[i], dst_texts[i]) for i in range(total) if src_has_latin[i] and same[i]),
+            max_show,
+        )
+    )
+    changed_examples = list(
+        islice(
+            ((i + 1, src_texts[i], dst_texts[i]) for i in range(total) if dst_cjk[i] and not same[i]),
+            max_show,
+        )
+    )
 
     print("[ok] docx translation report")
     print(f"- scopes: total={total} changed={changed} unchanged={unchanged}")
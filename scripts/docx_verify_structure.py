@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import argparse
+import io
+import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -9,33 +13,93 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 
-def _hash_docx(docx_path: Path) -> tuple[set[str], dict[str, str]]:
-    from doctranslator.docx_package import parse_xml_part, read_docx, structure_hash
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_TEXT_QNAMES = {f"{{{_W_NS}}}t", f"{{{_W_NS}}}delText", f"{{{_A_NS}}}t"}
+_ATTR_QNAMES = {"{http://www.w3.org/XML/1998/namespace}space"}
+_ATTR_PAIRS = {(f"{{{_W_NS}}}lvlText", f"{{{_W_NS}}}val")}
 
-    with read_docx(docx_path) as zin:
-        entries = {i.filename for i in zin.infolist()}
-        xml_entries = [
-            i.filename
-            for i in zin.infolist()
-            if i.filename.lower().endswith(".xml") and i.file_size > 0
-        ]
+# Part hashes keyed by (entry name, CRC32, size): unchanged parts skip parsing on later runs, and
+# the output document's untouched parts hit the entries its input just stored. Bump the version
+# whenever the masking sets or the hash function change. Entries are kept in least-recently-used
+# order and the file is cut to the newest _HASH_CACHE_MAX_ENTRIES on save (a docx has a few dozen
+# parts), so it stays bounded however many documents get verified.
+_HASH_CACHE_PATH = REPO_ROOT / "_trace" / "structure_hash_cache.json"
+_HASH_CACHE_VERSION = 1
+_HASH_CACHE_MAX_ENTRIES = 4096
 
-        parts = {}
-        for name in xml_entries:
-            part = parse_xml_part(name, zin.read(name))
-            parts[name] = part.tree
+# Below this much XML, starting worker processes costs more than hashing the parts serially.
+_PARALLEL_MIN_XML_BYTES = 8 << 20
 
-        w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        a = "http://schemas.openxmlformats.org/drawingml/2006/main"
-        text_qnames = {f"{{{w}}}t", f"{{{w}}}delText", f"{{{a}}}t"}
-        attr_qnames = {"{http://www.w3.org/XML/1998/namespace}space"}
-        attr_pairs = {(f"{{{w}}}lvlText", f"{{{w}}}val")}
+
+def _hash_stream(name: str, fh) -> str:
+    from doctranslator.docx_package import structure_hash_stream
+
+    return structure_hash_stream(
+        name, fh, text_qnames=_TEXT_QNAMES, attr_qnames=_ATTR_QNAMES, attr_pairs=_ATTR_PAIRS
+    )
+
+
+def _hash_part(item: tuple[str, bytes]) -> str:
+    name, data = item
+    return _hash_stream(name, io.BytesIO(data))
+
+
+def _load_hash_cache() -> dict[str, str]:
+    try:
+        data = json.loads(_HASH_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _HASH_CACHE_VERSION:
+        return {}
+    hashes = data.get("hashes")
+    return hashes if isinstance(hashes, dict) else {}
+
+
+def _save_hash_cache(cache: dict[str, str]) -> None:
+    if len(cache) > _HASH_CACHE_MAX_ENTRIES:
+        cache = dict(list(cache.items())[-_HASH_CACHE_MAX_ENTRIES:])
+    try:
+        _HASH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _HASH_CACHE_PATH.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": _HASH_CACHE_VERSION, "hashes": cache}), encoding="utf-8")
+        os.replace(tmp, _HASH_CACHE_PATH)
+    except OSError as exc:
+        print(f"[warn] could not write structure hash cache: {exc}")
+
+
+def _hash_docx(docx_path: Path, cache: dict[str, str]) -> tuple[set[str], dict[str, str]]:
+    from doctranslator.docx_package import read_docx_mapped
+
+    with read_docx_mapped(docx_path) as zin:
+        infos = zin.infolist()
+        entries = {i.filename for i in infos}
+        xml_infos = [i for i in infos if i.filename.lower().endswith(".xml") and i.file_size > 0]
 
         hashes = {}
-        for name, tree in parts.items():
-            hashes[name] = structure_hash(
-                tree, text_qnames=text_qnames, attr_qnames=attr_qnames, attr_pairs=attr_pairs
-            )
+        todo = []
+        for i in xml_infos:
+            key = f"{i.filename}:{i.CRC:08x}:{i.file_size}"
+            h = cache.pop(key, None)
+            if h is None:
+                todo.append(i)
+            else:
+                cache[key] = h  # re-insert: hits move to the recent end
+                hashes[i.filename] = h
+
+        # Parts hash independently; big documents spread them over processes (parsing holds the GIL).
+        if len(todo) >= 4 and sum(i.file_size for i in todo) >= _PARALLEL_MIN_XML_BYTES:
+            items = [(i.filename, zin.read(i.filename)) for i in todo]
+            with ProcessPoolExecutor(max_workers=min(len(items), os.cpu_count() or 1)) as pool:
+                hashes.update(zip((name for name, _data in items), pool.map(_hash_part, items)))
+        else:
+            for i in todo:
+                # Hash straight from the inflating member; neither the part bytes nor its tree is held.
+                with zin.open(i) as fh:
+                    hashes[i.filename] = _hash_stream(i.filename, fh)
+
+        for i in todo:
+            cache[f"{i.filename}:{i.CRC:08x}:{i.file_size}"] = hashes[i.filename]
         return entries, hashes
 
 
@@ -43,6 +107,7 @@ def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("input_docx", type=Path)
     ap.add_argument("output_docx", type=Path)
+    ap.add_argument("--no-cache", action="store_true", help="ignore and do not update the structure hash cache")
     args = ap.parse_args()
 
     if not args.input_docx.exists():
@@ -50,8 +115,12 @@ def main() -> int:
     if not args.output_docx.exists():
         raise FileNotFoundError(args.output_docx)
 
-    in_entries, in_hashes = _hash_docx(args.input_docx)
-    out_entries, out_hashes = _hash_docx(args.output_docx)
+    cache = {} if args.no_cache else _load_hash_cache()
+    cached = list(cache)
+    in_entries, in_hashes = _hash_docx(args.input_docx, cache)
+    out_entries, out_hashes = _hash_docx(args.output_docx, cache)
+    if not args.no_cache and list(cache) != cached:
+        _save_hash_cache(cache)
 
     missing = sorted(in_entries - out_entries)
     extra = sorted(out_entries - in_entries)
@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
 import os
 import re
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import requests
 
@@ -18,6 +21,10 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 
+# One keep-alive connection pool for every call to the local llama-server (health polls included).
+_SESSION = requests.Session()
+
+
 def _default_server_exe() -> Path:
     return REPO_ROOT / "llama-b7772-bin-win-cuda-13.1-x64" / "llama-server.exe"
 
@@ -31,7 +38,7 @@ def _wait_ready(base_url: str, timeout_s: float) -> None:
     last_err: Exception | None = None
     while time.time() < deadline:
         try:
-            r = requests.get(f"{base_url}/health", timeout=2)
+            r = _SESSION.get(f"{base_url}/health", timeout=2)
             if r.status_code == 200:
                 return
         except Exception as exc:  # noqa: BLE001
@@ -42,7 +49,7 @@ def _wait_ready(base_url: str, timeout_s: float) -> None:
 
 def _detect_model_id(base_url: str) -> str:
     try:
-        r = requests.get(f"{base_url}/v1/models", timeout=5)
+        r = _SESSION.get(f"{base_url}/v1/models", timeout=5)
         r.raise_for_status()
         data = r.json()
         items = data.get("data") or []
@@ -63,51 +70,71 @@ def _chat(base_url: str, model_id: str, prompt: str, *, max_tokens: int) -> str:
         "top_p": 0.9,
         "max_tokens": int(max_tokens),
     }
-    r = requests.post(f"{base_url}/v1/chat/completions", json=payload, timeout=600)
+    r = _SESSION.post(f"{base_url}/v1/chat/completions", json=payload, timeout=600)
     r.raise_for_status()
     data = r.json()
     return str(data["choices"][0]["message"]["content"])
 
 
-def _extract_json_obj(text: str) -> Any:
-    start = text.find("{")
-    if start == -1:
-        raise ValueError("no JSON object start")
+_JSON_DECODER = json.JSONDecoder()
 
-    in_string = False
-    escape = False
-    depth = 0
-    end: int | None = None
 
-    for i in range(start, len(text)):
-        ch = text[i]
-        if in_string:
-            if escape:
-                escape = False
-                continue
-            if ch == "\\":
-                escape = True
-                continue
-            if ch == '"':
-                in_string = False
-            continue
+def _import_orjson() -> Any:
+    try:
+        import orjson  # type: ignore[import-not-found]
+    except Exception:  # noqa: BLE001
+        return None
+    return orjson
+
 
-        if ch == '"':
-            in_string = True
-            continue
-        if ch == "{":
-            depth += 1
-            continue
-        if ch == "}":
-            depth -= 1
-            if depth == 0:
-                end = i + 1
-                break
+_ORJSON = _import_orjson()
 
-    if end is None:
-        raise ValueError("no balanced JSON object")
 
-    return json.loads(text[start:end])
+# orjson turns integer literals wider than 64 bits into floats (or rejects them); leave any
+# long digit run to the stdlib decoder, which keeps big ints exact.
+_LONG_DIGITS_RE = re.compile(r"\d{19}")
+
+
+def _extract_json_obj(text: str) -> Any:
+    start = text.find("{")
+    if start == -1:
+        raise ValueError("no JSON object start")
+    if _ORJSON is not None:
+        # If everything up to the last "}" is one JSON document, raw_decode() would return it too.
+        candidate = text[start : text.rfind("}") + 1]
+        if _LONG_DIGITS_RE.search(candidate) is None:
+            try:
+                return _ORJSON.loads(candidate)
+            except Exception:  # noqa: BLE001
+                pass
+    # raw_decode() finds the end of the object itself (in C), strings and escapes included.
+    obj, _end = _JSON_DECODER.raw_decode(text, start)
+    return obj
+
+
+def _orjson_dumps_like_stdlib(obj: Any) -> bool:
+    # orjson writes NaN/Infinity as null and exponents without a sign/zero-padding ("1e16" vs
+    # "1e+16"); everything else it emits matches json.dumps(indent=2, ensure_ascii=False).
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item) or "e" in repr(item):
+                return False
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return True
+
+
+def _dump_json(obj: Any) -> bytes:
+    if _ORJSON is not None and _orjson_dumps_like_stdlib(obj):
+        try:
+            return _ORJSON.dumps(obj, option=_ORJSON.OPT_INDENT_2)
+        except Exception:  # noqa: BLE001
+            pass  # e.g. integers beyond 64 bits
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
 
 
 def _repair_to_json(base_url: str, model_id: str, raw: str, *, max_tokens: int) -> str:
@@ -123,12 +150,77 @@ def _repair_to_json(base_url: str, model_id: str, raw: str, *, max_tokens: int)
     return _chat(base_url, model_id, prompt, max_tokens=max_tokens)
 
 
-def _extract_paragraphs_from_docx(docx_path: Path, max_items: int) -> list[tuple[int, str]]:
-    from doctranslator.docx_package import parse_xml_part, read_docx
+_MAIN_DOCUMENT_PART = "word/document.xml"
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+
+def _iter_document_paragraphs(name: str, fh) -> Iterator[str]:
+    from lxml import etree
+
+    from doctranslator.errors import DocxParseError
+    from doctranslator.extract import a_paragraph_surface, w_paragraph_surface
+
+    w_p = f"{{{_W_NS}}}p"
+    a_p = f"{{{_A_NS}}}p"
+    lvl_text = f"{{{_W_NS}}}lvlText"
+    # Same order as extract_scopes_from_xml: every w:p, then a:p, then lvlText. w:p are
+    # numbered on their start tag (document order, as findall(".//w:p") sees them) but only
+    # complete on their end tag; nested text-box paragraphs end before their host.
+    slots: list[str | None] = []
+    open_slots: list[int] = []
+    ready = 0
+    trailing: list[str] = []
+    try:
+        for event, elem in etree.iterparse(
+            fh, events=("start", "end"), tag=(w_p, a_p, lvl_text), resolve_entities=False, huge_tree=True
+        ):
+            if elem.tag != w_p:
+                if event == "end":
+                    if elem.tag == a_p:
+                        text = a_paragraph_surface(elem)
+                    else:
+                        text = elem.get(f"{{{_W_NS}}}val")
+                    if text and text.strip():
+                        trailing.append(text.strip())
+                continue
+            if event == "start":
+                open_slots.append(len(slots))
+                slots.append(None)
+                continue
+            slots[open_slots.pop()] = (w_paragraph_surface(elem) or "").strip()
+            if not open_slots:
+                elem.clear(keep_tail=True)
+            while ready < len(slots) and slots[ready] is not None:
+                text = slots[ready]
+                ready += 1
+                if text:
+                    yield text
+    except etree.XMLSyntaxError as exc:
+        raise DocxParseError(f"Failed to parse XML part {name}: {exc}") from exc
+    yield from trailing
+
+
+def _iter_part_paragraphs(zin, xml_names: list[str]) -> Iterator[str]:
+    from doctranslator.docx_package import parse_xml_stream
     from doctranslator.extract import extract_scopes_from_xml
 
-    paras: list[str] = []
-    with read_docx(docx_path) as zin:
+    for name in xml_names:
+        with zin.open(name) as fh:
+            if name == _MAIN_DOCUMENT_PART:
+                yield from _iter_document_paragraphs(name, fh)
+                continue
+            tree = parse_xml_stream(name, fh)
+        for sc in extract_scopes_from_xml(name, tree):
+            t = (sc.surface_text or "").strip()
+            if t:
+                yield t
+
+
+def _extract_paragraphs_from_docx(docx_path: Path, max_items: int) -> list[tuple[int, str]]:
+    from doctranslator.docx_package import read_docx_mapped
+
+    with read_docx_mapped(docx_path) as zin:
         xml_names = [
             info.filename
             for info in zin.infolist()
@@ -136,20 +228,10 @@ def _extract_paragraphs_from_docx(docx_path: Path, max_items: int) -> list[tuple
         ]
         # Prefer main document first.
         xml_names.sort(key=lambda n: (0 if "word/document" in n.replace("\\", "/") else 1, n))
-        for name in xml_names:
-            xml = zin.read(name)
-            part = parse_xml_part(name, xml)
-            scopes = extract_scopes_from_xml(name, part.tree)
-            for sc in scopes:
-                t = (sc.surface_text or "").strip()
-                if not t:
-                    continue
-                paras.append(t)
-                if len(paras) >= max_items:
-                    break
-            if len(paras) >= max_items:
-                break
-    return [(i + 1, paras[i]) for i in range(len(paras))]
+        # Parts are walked lazily, so a sample that fits in the head of document.xml stops
+        # there: document.xml is streamed and nothing after the cap is parsed.
+        paras = list(islice(_iter_part_paragraphs(zin, xml_names), max(0, max_items)))
+    return list(enumerate(paras, start=1))
 
 
 def main() -> int:
@@ -163,6 +245,12 @@ def main() -> int:
     ap.add_argument("--max-paras", type=int, default=120)
     ap.add_argument("--timeout", type=float, default=30.0)
     ap.add_argument("--max-tokens", type=int, default=2400)
+    ap.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="llama-server slots; prompts run concurrently, and the server gets --ctx-size ctx*N (N times the KV cache)",
+    )
     args = ap.parse_args()
 
     if not args.server_exe.exists():
@@ -177,6 +265,7 @@ def main() -> int:
     out_dir.mkdir(parents=True, exist_ok=True)
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+    parallel = max(1, int(args.parallel))
     cmd = [
         str(args.server_exe),
         "--host",
@@ -185,8 +274,11 @@ def main() -> int:
         str(int(args.port)),
         "--model",
         str(args.model),
+        # llama-server splits ctx-size across slots; keep --ctx per prompt.
+        "--parallel",
+        str(parallel),
         "--ctx-size",
-        str(int(args.ctx)),
+        str(int(args.ctx) * parallel),
         "--n-gpu-layers",
         str(int(args.gpu_layers)),
         "--threads",
@@ -240,11 +332,9 @@ def main() -> int:
             "hierarchy": prompt_hierarchy,
         }
 
-        for name, prompt in prompts.items():
+        def run_prompt(prompt: str) -> tuple[str, str | None, Any | None, str | None]:
             raw = _chat(base_url, model_id, prompt, max_tokens=int(args.max_tokens))
-            raw_path = out_dir / f"{ts}.{name}.raw.txt"
-            raw_path.write_text(raw, encoding="utf-8")
-
+            repaired: str | None = None
             parsed: Any | None = None
             err: str | None = None
             try:
@@ -253,19 +343,39 @@ def main() -> int:
                 err = str(exc)
                 try:
                     repaired = _repair_to_json(base_url, model_id, raw, max_tokens=int(args.max_tokens))
-                    repaired_path = out_dir / f"{ts}.{name}.repaired.raw.txt"
-                    repaired_path.write_text(repaired, encoding="utf-8")
                     parsed = _extract_json_obj(repaired)
                     err = None
                 except Exception as exc2:  # noqa: BLE001
                     err = f"{err}; repair_failed={exc2}"
+            return raw, repaired, parsed, err
+
+        # The prompts are independent; the server decodes them in separate slots at the same time.
+        with ThreadPoolExecutor(max_workers=min(parallel, len(prompts))) as ex:
+            futures = {name: ex.submit(run_prompt, prompt) for name, prompt in prompts.items()}
+
+        # Write every prompt that finished, even if another one's request failed.
+        first_exc: BaseException | None = None
+        for name, fut in futures.items():
+            exc = fut.exception()
+            if exc is not None:
+                print(f"[fail] {name}: request failed: {exc}")
+                first_exc = first_exc or exc
+                continue
+            raw, repaired, parsed, err = fut.result()
+            raw_path = out_dir / f"{ts}.{name}.raw.txt"
+            raw_path.write_text(raw, encoding="utf-8")
+            if repaired is not None:
+                repaired_path = out_dir / f"{ts}.{name}.repaired.raw.txt"
+                repaired_path.write_text(repaired, encoding="utf-8")
 
             if parsed is not None:
                 json_path = out_dir / f"{ts}.{name}.json"
-                json_path.write_text(json.dumps(parsed, ensure_ascii=False, indent=2), encoding="utf-8")
+                json_path.write_bytes(_dump_json(parsed))
                 print(f"[ok] {name}: {json_path}")
             else:
                 print(f"[warn] {name}: JSON parse failed: {err} (raw={raw_path})")
+        if first_exc is not None:
+            raise first_exc
 
     finally:
         try:
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("lxml")
+
+from doctranslator.ir import TranslationUnit  # noqa: E402
+from doctranslator.textutil import _detect_language_pair_from_tus  # noqa: E402
+
+
+def _body_tu(tu_id: int, text: str) -> TranslationUnit:
+    return TranslationUnit(
+        tu_id=tu_id,
+        part_name="word/document.xml",
+        scope_key=f"word/document.xml#w:p@{tu_id}",
+        atoms=[],
+        spans=[],
+        source_surface=text,
+        frozen_surface=text,
+    )
+
+
+def test_mixed_document_uses_whole_sample() -> None:
+    # A Chinese cover page must not decide the direction for an English body.
+    zh = "本协议由双方于签署之日订立并生效。"
+    en = "This Agreement is entered into by the parties and is effective as of the date of signature."
+    tus = [_body_tu(i, zh) for i in range(20)] + [_body_tu(20 + i, en) for i in range(180)]
+
+    detected = _detect_language_pair_from_tus(tus)
+
+    assert detected is not None
+    src, tgt, detail = detected
+    assert (src, tgt) == ("en", "zh")
+    assert "sampled=200" in detail